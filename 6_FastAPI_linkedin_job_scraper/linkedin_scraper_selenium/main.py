@@ -1,13 +1,17 @@
 import asyncio
-from src.driver_initialize_and_login import initialize_driver,login_to_linkedin
+from src.session_pool import SessionPool
 from src.get_company_names_1 import get_company_names
+from src.sharded_scraper import scrape_sharded
 from src.get_company_size_data_2 import scrape_company_data
 from src.get_decision_makers_with_google_search_api_3 import scrape_decision_makers_google_api
 from src.generate_final_output_4 import process_data
 
 if __name__ == "__main__":
-	driver = initialize_driver()
-	login_to_linkedin(driver)
+	NUM_COMPANY_WORKERS = 1  # >1 looks up companies in part 2 with several browsers at the same total rate
+
+	# Logged-in browsers shared by parts 1 and 2
+	session_pool = SessionPool(size=NUM_COMPANY_WORKERS)
+	driver = session_pool.acquire("part 1")
 
 	# Part 1 - get company names
 
@@ -25,27 +29,36 @@ if __name__ == "__main__":
 	LINKEDIN_COMPANY_SIZE_FILTER='["501-1,000 employees"]'
 	EXPERIENCE_LEVEL_FILTER = ["Entry level", "Associate", "Mid-Senior level"]
 
-	get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER, max_pages_scraped, EXPERIENCE_LEVEL_FILTER)
+	NUM_BROWSER_WORKERS = 1  # >1 scrapes with several browsers at once
+	SHARD_BY = "pages"  # "pages" (disjoint page ranges) OR "filters" (industry x experience level)
 
-	print("\nQuitting driver...\n")
-	driver.quit()
+	if NUM_BROWSER_WORKERS > 1:
+		# Release the logged-in profile so each worker can copy it
+		print("\nQuitting driver...\n")
+		session_pool.close()
+		scrape_sharded(LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER, max_pages_scraped, EXPERIENCE_LEVEL_FILTER,
+		               num_workers=NUM_BROWSER_WORKERS, shard_by=SHARD_BY)
+	else:
+		get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER, max_pages_scraped, EXPERIENCE_LEVEL_FILTER)
+		session_pool.release(driver)
 
 
 	# later UPDATE: sleep for 15 mins, change vpn, change linkedin account
 	# Part 2 - get company size data
 
-	driver = initialize_driver()
-	login_to_linkedin(driver)
 	csv_file_path = f"./scraped_data/1_get_company_names/linkedin_{JOB_TITLE}_jobs.csv"
 	try:
-		scrape_company_data(driver,JOB_TITLE, csv_file_path)
+		# Reuses the part 1 browser if it is still logged in
+		with session_pool.session("part 2") as driver:
+			scrape_company_data(driver,JOB_TITLE, csv_file_path, quit_driver=False,
+			                    session_pool=session_pool, num_workers=NUM_COMPANY_WORKERS)
 		print("Scraping completed successfully!")
 
 	except Exception as e:
 		print(f"Scraping failed: {str(e)}")
 
 	print("\nQuitting driver...\n")
-	driver.quit()
+	session_pool.close()
 
 	# Part 3 - get decision maker
 
@@ -0,0 +1,216 @@
+import json
+from html.parser import HTMLParser
+
+# Reads everything the parser needs from a company About page in one round trip:
+# <dt>/<dd> label-value groups, raw JSON-LD blocks and the About section's text
+ABOUT_SNAPSHOT_JS = """
+const textOf = node => (node.innerText || node.textContent || "").trim();
+const pairs = [];
+document.querySelectorAll("dl dt").forEach(dt => {
+    const values = [];
+    let node = dt.nextElementSibling;
+    while (node && node.tagName !== "DT") {
+        if (node.tagName === "DD") values.push(textOf(node));
+        node = node.nextElementSibling;
+    }
+    pairs.push([textOf(dt), values]);
+});
+const jsonld = Array.from(document.querySelectorAll("script[type='application/ld+json']")).map(s => s.textContent);
+const section = document.querySelector("section[class*='about']") || document.querySelector("section[class*='org-page-details']");
+return {pairs: pairs, jsonld: jsonld, text: section ? textOf(section) : ""};
+"""
+
+# LinkedIn's company size buckets, as used by LINKEDIN_COMPANY_SIZE_FILTER
+SIZE_BUCKETS = [
+    (10, "1-10 employees"), (50, "11-50 employees"), (200, "51-200 employees"), (500, "201-500 employees"),
+    (1000, "501-1,000 employees"), (5000, "1,001-5,000 employees"), (10000, "5,001-10,000 employees"),
+]
+LARGEST_BUCKET = "10,001+ employees"
+
+# Headings of the About page, never taken as a value by the text scan
+ABOUT_LABELS = {"Website", "Industry", "Company size", "Headquarters", "Founded", "Specialties", "Type",
+                "Verified page", "Phone", "Locations"}
+
+ORGANIZATION_TYPES = {"Organization", "Corporation", "LocalBusiness", "EducationalOrganization", "NGO"}
+
+
+def employees_to_size_bucket(count):
+    for upper, bucket in SIZE_BUCKETS:
+        if count <= upper:
+            return bucket
+    return LARGEST_BUCKET
+
+
+def _clean(value):
+    return " ".join((value or "").split())
+
+
+def _looks_like_website(value):
+    return "www" in value or "http" in value
+
+
+def parse_about_text(about_section_text):
+    """Label/next-line scan over the About section's text; every index is bounds-checked."""
+    lines = [line.strip() for line in (about_section_text or "").split('\n')]
+    website = industry = company_size = "unknown"
+
+    def line_at(i):
+        return lines[i] if i < len(lines) else ""
+
+    for i, line in enumerate(lines):
+        if line == "Website" and _looks_like_website(line_at(i + 1)):
+            website = line_at(i + 1)
+        elif line == "Industry" and line_at(i + 1) and line_at(i + 1) not in ABOUT_LABELS:
+            industry = line_at(i + 1)
+        elif line == "Company size" and "employees" in line_at(i + 1):
+            company_size = line_at(i + 1)
+
+    return website, industry, company_size
+
+
+def _from_pairs(pairs):
+    found = {}
+    for label, values in pairs or []:
+        label = _clean(label).lower()
+        values = [_clean(value) for value in values if _clean(value)]
+        if not values:
+            continue
+        if label == "website":
+            website = next((value for value in values if _looks_like_website(value) or "." in value), None)
+            if website:
+                found["website"] = website
+        elif label == "industry":
+            found["industry"] = values[0]
+        elif label == "company size":
+            size = next((value for value in values if "employees" in value), None)
+            if size:
+                found["company_size"] = size
+    return found
+
+
+def _organizations(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _organizations(item)
+    elif isinstance(data, dict):
+        if "@graph" in data:
+            yield from _organizations(data["@graph"])
+        types = data.get("@type")
+        types = set(types) if isinstance(types, list) else {types}
+        if types & ORGANIZATION_TYPES:
+            yield data
+
+
+def _from_jsonld(blocks):
+    found = {}
+    for block in blocks or []:
+        try:
+            data = json.loads(block)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for organization in _organizations(data):
+            same_as = organization.get("sameAs") or []
+            candidates = [organization.get("url")] + (same_as if isinstance(same_as, list) else [same_as])
+            website = next((url for url in candidates if isinstance(url, str) and url and "linkedin.com" not in url),
+                           None)
+            if website:
+                found.setdefault("website", website)
+            industry = organization.get("industry")
+            if isinstance(industry, str) and industry:
+                found.setdefault("industry", industry)
+            employees = organization.get("numberOfEmployees")
+            if isinstance(employees, dict):
+                count = employees.get("maxValue") or employees.get("value") or employees.get("minValue")
+            else:
+                count = employees
+            try:
+                found.setdefault("company_size", employees_to_size_bucket(int(count)))
+            except (TypeError, ValueError):
+                pass
+    return found
+
+
+def parse_about_snapshot(snapshot):
+    """
+    Extract website, industry and company size from an About page snapshot.
+
+    <dt>/<dd> pairs are used first, then JSON-LD, then the text scan for whatever is still missing.
+
+    Returns:
+        dict: website, industry, company_size ("unknown" if not found) and source, the
+            parser each field came from
+    """
+    snapshot = snapshot or {}
+    text_values = dict(zip(("website", "industry", "company_size"), parse_about_text(snapshot.get("text"))))
+    result, source = {}, {}
+    for name, found in (("dt_dd", _from_pairs(snapshot.get("pairs"))),
+                        ("json_ld", _from_jsonld(snapshot.get("jsonld"))),
+                        ("text", {k: v for k, v in text_values.items() if v != "unknown"})):
+        for field, value in found.items():
+            if field not in result:
+                result[field] = value
+                source[field] = name
+    return {
+        "website": result.get("website", "unknown"),
+        "industry": result.get("industry", "unknown"),
+        "company_size": result.get("company_size", "unknown"),
+        "source": source,
+    }
+
+
+def read_about_section(driver):
+    """Parse the About page currently open in driver with a single execute_script call."""
+    return parse_about_snapshot(driver.execute_script(ABOUT_SNAPSHOT_JS))
+
+
+class _AboutHtmlParser(HTMLParser):
+    """Builds the same snapshot as ABOUT_SNAPSHOT_JS from saved HTML."""
+
+    def __init__(self):
+        super().__init__()
+        self.pairs, self.jsonld, self.lines = [], [], []
+        self._current = None  # "dt", "dd" or "jsonld"
+        self._buffer = []
+        self._in_dl = 0
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "dl":
+            self._in_dl += 1
+        elif tag in ("dt", "dd") and self._in_dl:
+            self._current, self._buffer = tag, []
+        elif tag == "script" and attrs.get("type") == "application/ld+json":
+            self._current, self._buffer = "jsonld", []
+        elif tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag == "dl":
+            self._in_dl = max(0, self._in_dl - 1)
+        elif tag == self._current or (tag == "script" and self._current == "jsonld"):
+            value = "".join(self._buffer)
+            if self._current == "dt":
+                self.pairs.append([_clean(value), []])
+            elif self._current == "dd" and self.pairs:
+                self.pairs[-1][1].append(_clean(value))
+            elif self._current == "jsonld":
+                self.jsonld.append(value)
+            self._current = None
+        elif tag in ("script", "style"):
+            self._skip = max(0, self._skip - 1)
+
+    def handle_data(self, data):
+        if self._current:
+            self._buffer.append(data if self._current == "jsonld" else data + " ")
+        if self._skip or self._current == "jsonld":
+            return
+        if data.strip():
+            self.lines.append(data.strip())
+
+
+def snapshot_from_html(html):
+    """Snapshot of a saved About page, for offline re-parsing and the fixture benchmark."""
+    parser = _AboutHtmlParser()
+    parser.feed(html)
+    return {"pairs": parser.pairs, "jsonld": parser.jsonld, "text": "\n".join(parser.lines)}
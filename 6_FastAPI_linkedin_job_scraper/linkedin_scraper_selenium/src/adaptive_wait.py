@@ -0,0 +1,153 @@
+import os
+import random
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Human-like pause kept separate from the condition waits, so it can be tuned on its own
+MIN_JITTER = float(os.getenv("WAIT_MIN_JITTER", "0.2"))
+MAX_JITTER = float(os.getenv("WAIT_MAX_JITTER", "0.6"))
+
+# Resolves once the DOM has had no mutations for idle_ms, or with false after timeout_ms
+DOM_IDLE_JS = """
+const idleMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let finished = false;
+let idleTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(idleTimer);
+    idleTimer = setTimeout(() => finish(true), idleMs);
+});
+function finish(idle) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(idleTimer);
+    done(idle);
+}
+observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+idleTimer = setTimeout(() => finish(true), idleMs);
+setTimeout(() => finish(false), timeoutMs);
+"""
+
+JOB_CARD_XPATH = "//div[contains(@class, 'job-card-container')]"
+
+
+class AdaptiveWaiter:
+    """
+    Waits on concrete page conditions instead of fixed sleeps, and keeps per-step timing
+    stats split into condition waits and human-like jitter.
+
+    Args:
+        driver: Selenium WebDriver
+        min_jitter (float): Lower bound of the human-like pause in seconds
+        max_jitter (float): Upper bound of the human-like pause in seconds
+        poll_interval (float): How often conditions are re-checked
+    """
+
+    def __init__(self, driver, min_jitter=MIN_JITTER, max_jitter=MAX_JITTER, poll_interval=0.1):
+        self.driver = driver
+        self.min_jitter = min_jitter
+        self.max_jitter = max(min_jitter, max_jitter)
+        self.poll_interval = poll_interval
+        self.stats = defaultdict(lambda: {"count": 0, "wait": 0.0, "jitter": 0.0, "timeouts": 0})
+
+    def _record(self, step, kind, seconds):
+        self.stats[step][kind] += seconds
+
+    def human_pause(self, step, min_jitter=None, max_jitter=None):
+        """Sleep for the configured human-like jitter floor."""
+        low = self.min_jitter if min_jitter is None else min_jitter
+        high = self.max_jitter if max_jitter is None else max(low, max_jitter)
+        pause = random.uniform(low, high)
+        time.sleep(pause)
+        self._record(step, "jitter", pause)
+
+    def wait_until(self, step, condition, timeout=10):
+        """Wait until condition(driver) is truthy. Returns its value, or None on timeout."""
+        start = time.time()
+        self.stats[step]["count"] += 1
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            self.stats[step]["timeouts"] += 1
+            return None
+        finally:
+            self._record(step, "wait", time.time() - start)
+
+    def wait_for_dom_idle(self, step, idle_ms=300, timeout=5):
+        """Wait until no DOM mutations happen for idle_ms (MutationObserver in the page)."""
+        start = time.time()
+        self.stats[step]["count"] += 1
+        try:
+            self.driver.set_script_timeout(timeout + 1)
+            idle = self.driver.execute_async_script(DOM_IDLE_JS, idle_ms, int(timeout * 1000))
+        except Exception:
+            idle = False
+        if not idle:
+            self.stats[step]["timeouts"] += 1
+        self._record(step, "wait", time.time() - start)
+        return idle
+
+    def wait_for_job_selected(self, step, job_id, timeout=5):
+        """Wait until the top card shows the job with job_id (URL param or top card link)."""
+        if not job_id:
+            return self.wait_for_dom_idle(step, timeout=timeout)
+
+        def job_selected(driver):
+            if f"currentJobId={job_id}" in driver.current_url:
+                return True
+            return driver.execute_script(
+                "return !!document.querySelector(arguments[0]);",
+                f".jobs-unified-top-card a[href*='/jobs/view/{job_id}'], "
+                f".job-details-jobs-unified-top-card__job-title a[href*='/jobs/view/{job_id}'], "
+                f".jobs-search__job-details--container [data-job-id='{job_id}']")
+
+        return self.wait_until(step, job_selected, timeout)
+
+    def wait_for_job_count_stable(self, step, stable_for=0.75, timeout=6, xpath=JOB_CARD_XPATH):
+        """Wait until the number of job cards stops changing for stable_for seconds. Returns the count."""
+        state = {"count": -1, "since": time.time()}
+
+        def count_stable(driver):
+            count = len(driver.find_elements("xpath", xpath))
+            now = time.time()
+            if count != state["count"]:
+                state["count"] = count
+                state["since"] = now
+                return False
+            return count > 0 and now - state["since"] >= stable_for
+
+        self.wait_until(step, count_stable, timeout)
+        return max(state["count"], 0)
+
+    def wait_for_url_contains(self, step, fragment, timeout=10):
+        return self.wait_until(step, lambda driver: fragment in driver.current_url, timeout)
+
+    def report(self, label="", elapsed=None, reset=True):
+        """
+        Print per-step timing stats and the waiting vs. working split.
+
+        Args:
+            label (str): Shown in the header, e.g. "page 3"
+            elapsed (float): Wall-clock seconds for the period; whatever was not spent
+                waiting or in jitter is counted as working time
+            reset (bool): Clear the stats afterwards
+        """
+        total_wait = sum(s["wait"] for s in self.stats.values())
+        total_jitter = sum(s["jitter"] for s in self.stats.values())
+        total_work = max(0.0, elapsed - total_wait - total_jitter) if elapsed else 0.0
+        total = total_wait + total_jitter + total_work
+
+        print(f"\n⏱️ Timing stats {label}".rstrip())
+        for step, s in sorted(self.stats.items(), key=lambda item: -(item[1]["wait"] + item[1]["jitter"])):
+            print(f"   {step:<24} waits={s['count']:<4} wait={s['wait']:6.1f}s jitter={s['jitter']:6.1f}s "
+                  f"timeouts={s['timeouts']}")
+        if total:
+            print(f"   Waiting: {total_wait:.1f}s ({total_wait / total:.0%}), jitter: {total_jitter:.1f}s "
+                  f"({total_jitter / total:.0%}), working: {total_work:.1f}s ({total_work / total:.0%})")
+        if reset:
+            self.stats.clear()
@@ -0,0 +1,123 @@
+import os
+import shutil
+
+from selenium import webdriver
+
+# "visible": maximized, full rendering - use it for the first login and manual CAPTCHA solving
+# "performance": headless, no images/fonts/media/trackers, background features disabled
+BROWSER_MODE = os.getenv("BROWSER_MODE", "visible")
+
+BASE_PROFILE_FOLDER = "SeleniumChromeProfile"
+
+# Chrome refuses to start on a copied profile that still holds the original's locks
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/91.0.4472.124 Safari/537.36")
+
+# Network.setBlockedURLs patterns ("*" wildcards), applied in performance mode
+BLOCKED_URL_PATTERNS = [
+    # images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*media.licdn.com/dms/image*",
+    # fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    # video / audio
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist*",
+    # third-party trackers and LinkedIn's own analytics beacons
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*bat.bing.com*",
+    "*connect.facebook.net*", "*px.ads.linkedin.com*", "*snap.licdn.com*", "*/li/track*",
+]
+
+PERFORMANCE_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1920,1080",  # headless has no screen to maximize to
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--disable-extensions",
+    "--disable-notifications",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-component-update",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--disable-features=MediaRouter,OptimizationHints,Translate",
+]
+
+
+def build_chrome_options(profile_folder=None, mode=BROWSER_MODE):
+    """
+    Chrome options shared by every scraping browser.
+
+    Args:
+        profile_folder (str): user-data-dir to keep the LinkedIn session in, created if missing
+        mode (str): "visible" or "performance"
+    """
+    if mode not in ("visible", "performance"):
+        raise ValueError(f"Unknown browser mode: {mode}")
+
+    options = webdriver.ChromeOptions()
+    if profile_folder:
+        if not os.path.exists(profile_folder):
+            os.makedirs(profile_folder)
+        options.add_argument(f"user-data-dir={os.path.abspath(profile_folder)}")
+
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    # Add these to reduce detection and improve speed
+    options.add_argument("--disable-web-security")
+    options.add_argument("--allow-running-insecure-content")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    if mode == "performance":
+        for argument in PERFORMANCE_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_setting_values.media_stream": 2,
+        })
+    else:
+        options.add_argument("--start-maximized")
+    return options
+
+
+def derive_worker_profile(worker_id, base_profile=BASE_PROFILE_FOLDER):
+    """Return a per-worker Chrome profile folder, copied from the base profile on first use
+    so each worker starts with the same LinkedIn session."""
+    worker_profile = f"{base_profile}_worker_{worker_id}"
+    if not os.path.exists(worker_profile):
+        if os.path.exists(base_profile):
+            shutil.copytree(base_profile, worker_profile,
+                            ignore=shutil.ignore_patterns(*PROFILE_LOCK_FILES, "Cache", "Code Cache"))
+        else:
+            os.makedirs(worker_profile)
+    return worker_profile
+
+
+def block_heavy_requests(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block matching requests for the whole browser session through the DevTools protocol."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except Exception as e:
+        print(f"⚠️ Could not enable request blocking: {e}")
+
+
+def create_chrome_driver(profile_folder=None, mode=BROWSER_MODE):
+    """Start Chrome in the given mode. The mode is kept on driver.browser_mode."""
+    driver = webdriver.Chrome(options=build_chrome_options(profile_folder, mode))
+    if mode == "performance":
+        block_heavy_requests(driver)
+    driver.browser_mode = mode
+    return driver
+
+
+def is_headless(driver):
+    return getattr(driver, "browser_mode", "visible") == "performance"
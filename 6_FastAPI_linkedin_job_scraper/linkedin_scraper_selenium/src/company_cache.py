@@ -0,0 +1,102 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from src.company_slug_cache import normalize_company_name
+
+COMPANY_CACHE_PATH = os.getenv("COMPANY_CACHE_PATH", "./scraped_data/cache/company_cache.db")
+COMPANY_CACHE_TTL_DAYS = float(os.getenv("COMPANY_CACHE_TTL_DAYS", "30"))
+# "refresh_stale": only companies missing from the cache or older than the TTL are scraped
+# "refresh_all": every company is scraped again (the cache is still updated)
+COMPANY_CACHE_MODE = os.getenv("COMPANY_CACHE_MODE", "refresh_stale")
+
+COMPANY_FIELDS = ('website', 'industry', 'company_size')
+
+
+class CompanyCache:
+    """
+    Company enrichment results kept across runs and job titles (SQLite).
+
+    Companies recur across searches, so a company fetched within ttl_days is not looked up
+    again. Results where nothing could be extracted are not stored.
+
+    Args:
+        db_path (str): SQLite file
+        ttl_days (float): How long an entry counts as fresh
+    """
+
+    def __init__(self, db_path=COMPANY_CACHE_PATH, ttl_days=COMPANY_CACHE_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS companies (
+                name_key TEXT PRIMARY KEY,
+                company_name TEXT NOT NULL,
+                website TEXT,
+                industry TEXT,
+                company_size TEXT,
+                slug TEXT,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, company_name):
+        """Return {website, industry, company_size, slug, fetched_at, fresh} or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT website, industry, company_size, slug, fetched_at FROM companies WHERE name_key = ?",
+                (normalize_company_name(company_name),)).fetchone()
+        if not row:
+            return None
+        entry = dict(zip(COMPANY_FIELDS + ('slug', 'fetched_at'), row))
+        cutoff = (datetime.utcnow() - timedelta(days=self.ttl_days)).strftime('%Y-%m-%d %H:%M:%S')
+        entry['fresh'] = entry['fetched_at'] >= cutoff
+        return entry
+
+    def get_fresh(self, company_name):
+        entry = self.get(company_name)
+        return entry if entry and entry['fresh'] else None
+
+    def put(self, company_name, data, slug=None):
+        """Store a lookup result; results without any known field are skipped."""
+        if all((data.get(field) or "unknown") == "unknown" for field in COMPANY_FIELDS):
+            return False
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO companies (name_key, company_name, website, industry, company_size, slug, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name_key) DO UPDATE SET
+                    website = excluded.website, industry = excluded.industry,
+                    company_size = excluded.company_size, slug = COALESCE(excluded.slug, companies.slug),
+                    fetched_at = excluded.fetched_at
+            """, (normalize_company_name(company_name), company_name, data.get('website'), data.get('industry'),
+                  data.get('company_size'), slug, now))
+        return True
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+company_cache = None
+
+
+def get_company_cache():
+    """Shared cache, opened on first use."""
+    global company_cache
+    if company_cache is None:
+        company_cache = CompanyCache(COMPANY_CACHE_PATH, COMPANY_CACHE_TTL_DAYS)
+    return company_cache
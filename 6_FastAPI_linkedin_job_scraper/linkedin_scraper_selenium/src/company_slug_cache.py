@@ -0,0 +1,99 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+COMPANY_SLUG_CACHE_PATH = os.getenv("COMPANY_SLUG_CACHE_PATH", "./scraped_data/cache/company_slugs.db")
+
+COMPANY_SLUG_RE = re.compile(r"linkedin\.com/company/([^/?#]+)")
+
+
+def normalize_company_name(company_name):
+    """Case- and whitespace-insensitive lookup key for a company name."""
+    return " ".join((company_name or "").lower().split())
+
+
+def parse_company_slug(url):
+    """Return the <slug> of a https://www.linkedin.com/company/<slug>/... URL, or None."""
+    match = COMPANY_SLUG_RE.search(url or "")
+    return match.group(1) if match else None
+
+
+def company_about_url(slug):
+    return f"https://www.linkedin.com/company/{slug}/about/"
+
+
+class CompanySlugCache:
+    """
+    Company name -> LinkedIn /company/<slug>/ mapping (SQLite).
+
+    Filled by stage 1 from the job card's company link and by stage 2 whenever a company
+    had to be found through search, so stage 2 can open the About page directly.
+    """
+
+    def __init__(self, db_path=COMPANY_SLUG_CACHE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_slugs (
+                name_key TEXT PRIMARY KEY,
+                company_name TEXT NOT NULL,
+                slug TEXT NOT NULL,
+                source TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, company_name):
+        with self._lock:
+            row = self.conn.execute("SELECT slug FROM company_slugs WHERE name_key = ?",
+                                    (normalize_company_name(company_name),)).fetchone()
+        return row[0] if row else None
+
+    def remember_many(self, pairs, source=""):
+        """Record (company_name, slug) pairs; the latest slug for a name wins."""
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(normalize_company_name(name), name, slug, source, now) for name, slug in pairs if name and slug]
+        if not rows:
+            return
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO company_slugs (name_key, company_name, slug, source, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(name_key) DO UPDATE SET slug = excluded.slug, source = excluded.source, "
+                "updated_at = excluded.updated_at", rows)
+            self.conn.commit()
+
+    def remember(self, company_name, slug, source=""):
+        self.remember_many([(company_name, slug)], source)
+
+    def forget(self, company_name):
+        """Drop a slug that no longer leads to a company page."""
+        with self._lock:
+            self.conn.execute("DELETE FROM company_slugs WHERE name_key = ?", (normalize_company_name(company_name),))
+            self.conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM company_slugs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+company_slug_cache = None
+
+
+def get_company_slug_cache():
+    """Shared cache, opened on first use."""
+    global company_slug_cache
+    if company_slug_cache is None:
+        company_slug_cache = CompanySlugCache(COMPANY_SLUG_CACHE_PATH)
+    return company_slug_cache
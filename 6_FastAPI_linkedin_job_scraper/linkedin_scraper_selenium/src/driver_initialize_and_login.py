@@ -1,7 +1,6 @@
 import os
 import time
 from dotenv import load_dotenv
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,46 +8,43 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from src.get_company_size_data_2 import human_type
+from src.input_strategies import INPUT_STRATEGY_LOGIN
+from src.browser_profile import create_chrome_driver, is_headless, BROWSER_MODE
+from src.session_snapshot import (verify_session, save_session_snapshot, restore_session_snapshot,
+                                  delete_session_snapshot)
 
 load_dotenv()
 LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL')
 LINKEDIN_PASSWORD = os.getenv('LINKEDIN_PASSWORD')
 
 
-def initialize_driver():
-    # Default path if run directly
-    # Configure Chrome options (headless=False as requested)
-    chrome_options = webdriver.ChromeOptions()
-
-    # Define profile folder name
-    profile_folder = "SeleniumChromeProfile"
-    # Create folder if it doesn't exist
-    if not os.path.exists(profile_folder):
-        os.makedirs(profile_folder)
-
-    profile_path = os.path.abspath("./SeleniumChromeProfile")
-    chrome_options.add_argument(f"user-data-dir={profile_path}")
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    # Add these to reduce detection and improve speed
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-
-    driver = webdriver.Chrome(options=chrome_options)
-    return driver
-
-
-def login_to_linkedin(driver):
-    """Login to LinkedIn with credentials and handle verification if needed"""
-    driver.get("https://www.linkedin.com/login")
+def initialize_driver(profile_folder="SeleniumChromeProfile", mode=BROWSER_MODE):
+    """Start Chrome on a persistent profile. mode="performance" runs headless without images,
+    fonts, media or trackers; "visible" keeps a normal window for manual CAPTCHA solving."""
+    return create_chrome_driver(profile_folder, mode)
+
+
+def login_to_linkedin(driver, use_snapshot=True):
+    """Login to LinkedIn with credentials and handle verification if needed
 
+    The profile's own cookies are checked first, then a saved session snapshot; the
+    credential login only runs when neither holds a valid session.
+    """
     # check if provided driver already has an active linkedin session
+    if verify_session(driver):
+        print("\nAlready logged in...\n")
+        driver.get("https://www.linkedin.com/feed/")
+        return True
+
+    if use_snapshot and restore_session_snapshot(driver):
+        if verify_session(driver):
+            print("\n♻️ Session restored from snapshot\n")
+            driver.get("https://www.linkedin.com/feed/")
+            return True
+        print("⚠️ Saved session expired, logging in with credentials")
+        delete_session_snapshot()
+
+    driver.get("https://www.linkedin.com/login")
     success_selectors = [
         "//nav[@aria-label='Global navigation']",
         "//nav[contains(@class, 'global-nav')]",
@@ -57,22 +53,12 @@ def login_to_linkedin(driver):
         "//span[text()='Home']"
     ]
 
-    for selector in success_selectors:
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, selector))
-            )
-            print("\nAlready logged in...\n")
-            return True
-        except TimeoutException:
-            continue
-
     try:
         # Type email and password
         human_type(WebDriverWait(driver, 20).until(
-            EC.visibility_of_element_located((By.ID, "username"))), LINKEDIN_EMAIL)
+            EC.visibility_of_element_located((By.ID, "username"))), LINKEDIN_EMAIL, INPUT_STRATEGY_LOGIN)
         password_field = driver.find_element(By.ID, "password")
-        human_type(password_field, LINKEDIN_PASSWORD)
+        human_type(password_field, LINKEDIN_PASSWORD, INPUT_STRATEGY_LOGIN)
         password_field.send_keys(Keys.RETURN)
 
         print("⏳ Waiting for login to complete...")
@@ -82,6 +68,9 @@ def login_to_linkedin(driver):
         try:
             # Check for CAPTCHA or security challenge
             if "challenge" in driver.current_url.lower() or "captcha" in driver.current_url.lower():
+                if is_headless(driver):
+                    print("🔒 Security challenge detected in headless mode. Log in once with BROWSER_MODE=visible.")
+                    return False
                 print("🔒 Security challenge detected. Please complete manually and press Enter to continue...")
                 input()
                 # Wait additional time after manual verification
@@ -89,6 +78,9 @@ def login_to_linkedin(driver):
 
             # Check for email verification or additional security steps
             if "add-phone" in driver.current_url or "checkpoint" in driver.current_url:
+                if is_headless(driver):
+                    print("📧 Verification step required in headless mode. Log in once with BROWSER_MODE=visible.")
+                    return False
                 print("📧 Email verification or additional security step required.")
                 print("Please complete the verification manually and press Enter to continue...")
                 input()
@@ -114,6 +106,9 @@ def login_to_linkedin(driver):
 
             if login_successful:
                 print("✅ Login successful!")
+                if use_snapshot and verify_session(driver):
+                    save_session_snapshot(driver)
+                    driver.get("https://www.linkedin.com/feed/")
                 return True
             else:
                 print(f"❌ Login verification failed. Current URL: {driver.current_url}")
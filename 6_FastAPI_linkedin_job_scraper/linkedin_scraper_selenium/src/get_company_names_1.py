@@ -1,10 +1,8 @@
 import os
 import time
 import csv
-import random
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,32 +11,92 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from src.summarization_pipeline import SummarizationPipeline
+from src.summary_cache import SummaryCache, make_summary_key
+from src.adaptive_wait import AdaptiveWaiter
+from src.selector_registry import SelectorRegistry
+from src.job_csv_writer import JobCsvWriter, JOB_FIELDNAMES
+from src.seen_jobs_index import SeenJobsIndex
+from src.metadata_store import MetadataStore
+from src.browser_profile import create_chrome_driver, BROWSER_MODE
+from src.company_slug_cache import get_company_slug_cache, parse_company_slug
+from src.input_strategies import type_text, INPUT_STRATEGY_JOB_SEARCH
+
+
+# Used only for a search that has no watermark in the metadata store yet
+DEFAULT_LAST_SCRAPING_DATE = "2025-06-15 10:20"
+METADATA_DB_PATH = os.getenv("METADATA_DB_PATH", "./scraped_data/metadata.db")
+# The next watermark is set this far before the run started, to catch late-indexed jobs
+WATERMARK_OVERLAP_HOURS = float(os.getenv("WATERMARK_OVERLAP_HOURS", "1"))
+# Sort results newest first and stop paginating once this fraction of a page's dated jobs is stale
+STOP_WHEN_STALE = os.getenv("STOP_WHEN_STALE", "1") == "1"
+STALE_PAGE_FRACTION = float(os.getenv("STALE_PAGE_FRACTION", "0.8"))
+groq_api_key = os.getenv("GROQ_API_KEY")
+# Override to point summarization at a local fake LLM server when testing
+GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
+SUMMARY_MAX_WORKERS = int(os.getenv("SUMMARY_MAX_WORKERS", "4"))  # concurrent LLM calls
+SUMMARY_QUEUE_SIZE = int(os.getenv("SUMMARY_QUEUE_SIZE", "16"))  # descriptions waiting for a worker
+SUMMARY_MODEL = "llama-3.1-8b-instant"  # or "llama-3.1-70b-versatile"
+SUMMARY_SYSTEM_PROMPT = "You summarize job descriptions. Output ONLY the summary, no extra text or explanations."
+SUMMARY_PROMPT = "Summarize in exactly 30 words or less:"
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", "./scraped_data/cache/summary_cache.db")
+SUMMARY_CACHE_MAX_MB = int(os.getenv("SUMMARY_CACHE_MAX_MB", "50"))
+# "snapshot": one execute_script per job for the whole top card, "legacy": one wait per selector
+TOP_CARD_EXTRACTION_MODE = os.getenv("TOP_CARD_EXTRACTION_MODE", "snapshot")
+SELECTOR_STATS_PATH = os.getenv("SELECTOR_STATS_PATH", "./scraped_data/cache/selector_stats.json")
+SEEN_JOBS_INDEX_PATH = os.getenv("SEEN_JOBS_INDEX_PATH", "./scraped_data/cache/seen_jobs.db")
+SEEN_JOBS_WITHIN_DAYS = float(os.getenv("SEEN_JOBS_WITHIN_DAYS", "30"))  # 0 re-scrapes known jobs
 
+# Learns which fallback selector matches and tries it first next time
+selector_registry = SelectorRegistry(SELECTOR_STATS_PATH)
 
-# last_scraping_date should not be taken from main.py
-last_scraping_date = "2025-06-15 10:20" # later take from metadata table
-groq_api_key = os.getenv("GROQ_API_KEY")
+# Shared connection pool for summarization workers
+groq_session = requests.Session()
+groq_session.mount("https://", HTTPAdapter(pool_maxsize=SUMMARY_MAX_WORKERS))
+groq_session.mount("http://", HTTPAdapter(pool_maxsize=SUMMARY_MAX_WORKERS))
 
-def summarize_job_description(description):
+summary_cache = None  # opened on first use
+
+
+def get_summary_cache():
+    """Open the persistent summary cache on first use."""
+    global summary_cache
+    if summary_cache is None:
+        summary_cache = SummaryCache(SUMMARY_CACHE_PATH, SUMMARY_CACHE_MAX_MB * 1024 * 1024)
+    return summary_cache
+
+
+seen_jobs_index = None  # opened on first use
+
+
+def get_seen_jobs_index():
+    """Open the persistent index of already scraped job ids on first use."""
+    global seen_jobs_index
+    if seen_jobs_index is None:
+        seen_jobs_index = SeenJobsIndex(SEEN_JOBS_INDEX_PATH, SEEN_JOBS_WITHIN_DAYS)
+    return seen_jobs_index
+
+
+def request_job_summary(description):
     """Send description to LLM for summarization using OpenAI API."""
     try:
         # Set your API key - add this to your .env file
-
-        # Default prompt if none provided
-        prompt = "Summarize in exactly 30 words or less:"
-
-        response = requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
+        response = groq_session.post(
+            GROQ_API_URL,
+            timeout=60,
             headers={
                 "Authorization": f"Bearer {groq_api_key}",
                 "Content-Type": "application/json"
             },
             json={
-                "model": "llama-3.1-8b-instant",  # or "llama-3.1-70b-versatile"
+                "model": SUMMARY_MODEL,
                 "messages": [
                     {"role": "system",
-                     "content": "You summarize job descriptions. Output ONLY the summary, no extra text or explanations."},
-                    {"role": "user", "content": f"{prompt}\n\n{description}"}
+                     "content": SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"{SUMMARY_PROMPT}\n\n{description}"}
                 ],
                 "max_tokens": 75,
                 "temperature": 0.3
@@ -54,6 +112,19 @@ def summarize_job_description(description):
     except Exception as e:
         return f"API Error: {str(e)}"
 
+
+def summarize_job_description(description):
+    """Summarize a job description, consulting the persistent summary cache before calling the LLM."""
+    if not description or description == "unknown":
+        return request_job_summary(description)
+
+    key = make_summary_key(description, SUMMARY_MODEL, SUMMARY_SYSTEM_PROMPT + "\n" + SUMMARY_PROMPT)
+    return get_summary_cache().get_or_compute(
+        key,
+        lambda: request_job_summary(description),
+        should_store=lambda summary: not summary.startswith(("Error:", "API Error:"))
+    )
+
 def is_job_recent(posted_on_str, last_scraping_date_str):
     """Check if job posted_on date is after last_scraping_date."""
     try:
@@ -78,56 +149,83 @@ if not LINKEDIN_EMAIL or not LINKEDIN_PASSWORD:
     raise ValueError("Missing credentials in .env file!")
 
 
+def parse_relative_time(time_text):
+    """Convert text like "23 hours ago" or "Reposted 4 days ago" to a UTC 'YYYY-MM-DD HH:MM' string.
+
+    Returns None if the text has no relative time in it.
+    """
+    # Extract number and unit from patterns like "23 hours ago", "Reposted 4 days ago"
+    match = re.search(r'(\d+)\s+(minute|hour|day|week|month)s?\s+ago', time_text)
+    if not match:
+        return None
+
+    number = int(match.group(1))
+    unit = match.group(2)
+
+    # Calculate posted_on date
+    now = datetime.utcnow()
+    if unit == 'minute':
+        posted_on = now - timedelta(minutes=number)
+    elif unit == 'hour':
+        posted_on = now - timedelta(hours=number)
+    elif unit == 'day':
+        posted_on = now - timedelta(days=number)
+    elif unit == 'week':
+        posted_on = now - timedelta(weeks=number)
+    else:
+        posted_on = now - timedelta(days=30 * number)
+
+    return posted_on.strftime('%Y-%m-%d %H:%M')
+
+
 def parse_posted_date(cleaned_location_string):
     try:
         parts = cleaned_location_string.split('·')
         if len(parts) < 2:
             raise ValueError("Invalid format")
 
-        time_part = parts[1].strip()
-
-        # Extract number and unit from patterns like "23 hours ago", "Reposted 4 days ago"
-        match = re.search(r'(\d+)\s+(minute|hour|day|week)s?\s+ago', time_part)
-        if not match:
+        posted_on = parse_relative_time(parts[1].strip())
+        if not posted_on:
             raise ValueError("Time pattern not found")
 
-        number = int(match.group(1))
-        unit = match.group(2)
-
-        # Calculate posted_on date
-        now = datetime.utcnow()
-        if unit == 'minute':
-            posted_on = now - timedelta(minutes=number)
-        elif unit == 'hour':
-            posted_on = now - timedelta(hours=number)
-        elif unit == 'day':
-            posted_on = now - timedelta(days=number)
-        elif unit == 'week':
-            posted_on = now - timedelta(weeks=number)
-
-        return posted_on.strftime('%Y-%m-%d %H:%M')
+        return posted_on
 
     except Exception as e:
         print(f"Error parsing date: {e}")
         return datetime.utcnow().strftime('%Y-%m-%d %H:%M')
 
 
-def initialize_driver():
+def parse_job_id(job_url):
+    """Extract the numeric LinkedIn job id from a job URL, or None."""
+    match = re.search(r'(?:/jobs/view/|currentJobId=)(\d+)', job_url or "")
+    return match.group(1) if match else None
+
+
+def get_card_posted_date(job_card):
+    """Read the posted date from a job card in the results list, without clicking it.
+
+    Returns a 'YYYY-MM-DD HH:MM' UTC string, or None if the card does not show one.
+    """
+    try:
+        for time_element in job_card.find_elements(By.TAG_NAME, "time"):
+            posted_on = parse_relative_time(time_element.text.strip())
+            if posted_on:
+                return posted_on
+
+            # Only a calendar date is available - assume the end of that day so a job
+            # is never rejected earlier than it would be from the top card
+            datetime_attr = time_element.get_attribute("datetime")
+            if datetime_attr:
+                posted_day = datetime.strptime(datetime_attr[:10], '%Y-%m-%d')
+                return posted_day.strftime('%Y-%m-%d') + " 23:59"
+    except Exception:
+        pass
+    return None
+
+
+def initialize_driver(mode=BROWSER_MODE):
     """Initialize Chrome WebDriver with options."""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    # Add these to reduce detection and improve speed
-    options.add_argument("--disable-web-security")
-    options.add_argument("--allow-running-insecure-content")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-
-    driver = webdriver.Chrome(options=options)
+    driver = create_chrome_driver(mode=mode)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     return driver
 
@@ -248,15 +346,7 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//input[contains(@class, 'jobs-search-box__text-input')]"
             ]
 
-            title_field = None
-            for selector in title_selectors:
-                try:
-                    title_field = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
+            title_field, _ = selector_registry.wait_for_first(driver, "search_title_field", title_selectors, 3)
 
             if not title_field:
                 print("❌ Could not find job title search field")
@@ -264,7 +354,7 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
 
             title_field.clear()
             time.sleep(0.5)
-            title_field.send_keys(title)
+            type_text(title_field, title, INPUT_STRATEGY_JOB_SEARCH)
             time.sleep(1)
 
         except Exception as e:
@@ -279,20 +369,12 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//input[contains(@class, 'jobs-search-box__text-input')][2]"
             ]
 
-            location_field = None
-            for selector in location_selectors:
-                try:
-                    location_field = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
+            location_field, _ = selector_registry.wait_for_first(driver, "search_location_field", location_selectors, 3)
 
             if location_field:
                 location_field.clear()
                 time.sleep(0.5)
-                location_field.send_keys(location)
+                type_text(location_field, location, INPUT_STRATEGY_JOB_SEARCH)
                 time.sleep(1)
 
             # Press Enter to search
@@ -314,15 +396,8 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//button[@id='searchFilter_timePostedRange']"
             ]
 
-            date_filter_button = None
-            for selector in date_filter_selectors:
-                try:
-                    date_filter_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
+            date_filter_button, _ = selector_registry.wait_for_first(
+                driver, "date_filter_button", date_filter_selectors, 3, EC.element_to_be_clickable)
 
             if date_filter_button:
                 date_filter_button.click()
@@ -336,15 +411,11 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
 
                 if date_posted in date_options:
                     option_clicked = False
-                    for option_selector in date_options[date_posted]:
-                        try:
-                            WebDriverWait(driver, 2).until(
-                                EC.element_to_be_clickable((By.XPATH, option_selector))
-                            ).click()
-                            option_clicked = True
-                            break
-                        except TimeoutException:
-                            continue
+                    option_element, _ = selector_registry.wait_for_first(
+                        driver, f"date_option_{date_posted}", date_options[date_posted], 2, EC.element_to_be_clickable)
+                    if option_element:
+                        option_element.click()
+                        option_clicked = True
 
                     if option_clicked:
                         time.sleep(1)
@@ -355,14 +426,10 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                             "//button[@data-control-name='filter_apply']"
                         ]
 
-                        for apply_selector in apply_selectors:
-                            try:
-                                WebDriverWait(driver, 2).until(
-                                    EC.element_to_be_clickable((By.XPATH, apply_selector))
-                                ).click()
-                                break
-                            except TimeoutException:
-                                continue
+                        apply_button, _ = selector_registry.wait_for_first(
+                            driver, "date_filter_apply", apply_selectors, 2, EC.element_to_be_clickable)
+                        if apply_button:
+                            apply_button.click()
 
                         time.sleep(2)
 
@@ -383,15 +450,8 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//span[@class='artdeco-button__text' and contains(text(), 'All filters')]/parent::button"
             ]
 
-            all_filters_button = None
-            for selector in all_filters_selectors:
-                try:
-                    all_filters_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    break
-                except:
-                    continue
+            all_filters_button, _ = selector_registry.wait_for_first(
+                driver, "all_filters_button", all_filters_selectors, 3, EC.element_to_be_clickable)
 
             if not all_filters_button:
                 print("❌ All filters button not found")
@@ -413,15 +473,7 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//*[text()='Industry']"
             ]
 
-            industry_section = None
-            for selector in industry_selectors:
-                try:
-                    industry_section = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    break
-                except:
-                    continue
+            industry_section, _ = selector_registry.wait_for_first(driver, "industry_section", industry_selectors, 3)
 
             if industry_section:
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", industry_section)
@@ -456,15 +508,8 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//*[text()='Experience level']"
             ]
 
-            experience_section = None
-            for selector in experience_selectors:
-                try:
-                    experience_section = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    break
-                except:
-                    continue
+            experience_section, _ = selector_registry.wait_for_first(
+                driver, "experience_section", experience_selectors, 3)
 
             if experience_section:
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", experience_section)
@@ -498,14 +543,10 @@ def apply_job_filters(driver, title, location, date_posted, industry_filter, exp
                 "//button[contains(@class, 'search-reusables__secondary-filters-show-results-button')]"
             ]
 
-            for selector in show_results_selectors:
-                try:
-                    WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    ).click()
-                    break
-                except:
-                    continue
+            show_results_button, _ = selector_registry.wait_for_first(
+                driver, "show_results_button", show_results_selectors, 3, EC.element_to_be_clickable)
+            if show_results_button:
+                show_results_button.click()
 
             time.sleep(2)
             print("✅ Industry filter applied")
@@ -560,35 +601,146 @@ def get_total_pages(driver):
         return None
 
 
-def navigate_to_next_page(driver, current_page, max_retries=3):
+# Fallback selectors for the job details panel, tried in order
+TOP_CARD_SELECTORS = {
+    "title": [
+        "//h1[contains(@class, 't-24')]"
+    ],
+    "company": [
+        "//div[contains(@class, 'jobs-unified-top-card__company-name')]//a"
+    ],
+    "location": [
+        "//span[contains(@class, 'jobs-unified-top-card__bullet')]",
+        "//span[contains(@class, 'jobs-unified-top-card__subtitle-item')]",
+        "//div[contains(@class, 'jobs-unified-top-card__company-name')]/following-sibling::div//li[1]",
+        "//div[contains(@class, 'jobs-unified-top-card__primary-description')]//span",
+        "//div[contains(@class, 'job-details-jobs-unified-top-card__primary-description')]//span",
+        "//span[contains(@class, 'topcard__flavor--bullet')]"
+    ],
+    "description": [
+        "//div[contains(@class, 'jobs-description__details')]",
+        "//div[contains(@class, 'jobs-description-content')]",
+        "//section[contains(@class, 'jobs-description')]"
+    ]
+}
+
+# Returns {field: text} for every field in arguments[0], plus the selector that matched each one
+# and the link (href) around or inside the matched element
+TOP_CARD_SNAPSHOT_JS = """
+const selectorsByField = arguments[0];
+const snapshot = {matched: {}, links: {}};
+for (const [field, selectors] of Object.entries(selectorsByField)) {
+    snapshot[field] = "";
+    for (const selector of selectors) {
+        const node = document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const text = node ? (node.innerText || node.textContent || "").trim() : "";
+        if (text) {
+            snapshot[field] = text;
+            snapshot.matched[field] = selector;
+            const link = node.closest("a") || node.querySelector("a");
+            if (link) snapshot.links[field] = link.href;
+            break;
+        }
+    }
+}
+return snapshot;
+"""
+
+
+def extract_top_card_snapshot(driver, timeout=3, poll_interval=0.2):
+    """Read title, company, location and description of the selected job in one execute_script call.
+
+    The snapshot is retried until the title and description have rendered, or until timeout.
+    """
+    ordered_selectors = {field: selector_registry.ordered(f"top_card_{field}", selectors)
+                         for field, selectors in TOP_CARD_SELECTORS.items()}
+    deadline = time.time() + timeout
+    while True:
+        snapshot = driver.execute_script(TOP_CARD_SNAPSHOT_JS, ordered_selectors) or {}
+        if (snapshot.get("title") and snapshot.get("description")) or time.time() >= deadline:
+            break
+        time.sleep(poll_interval)
+
+    matched = snapshot.get("matched", {})
+    for field, selectors in ordered_selectors.items():
+        selector_registry.record_chain(f"top_card_{field}", selectors, matched.get(field))
+
+    return {
+        "title": snapshot.get("title", ""),
+        "company": snapshot.get("company", ""),
+        "company_url": (snapshot.get("links") or {}).get("company", ""),
+        "location": snapshot.get("location", ""),
+        "description": snapshot.get("description") or "unknown",
+        "matched": snapshot.get("matched", {})
+    }
+
+
+def find_first_text(driver, chain, selectors, timeout):
+    """Return the text of the first selector that is present and non-empty, waiting up to timeout for each."""
+    for selector in selector_registry.ordered(chain, selectors):
+        try:
+            element = WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, selector)))
+            text = element.text.strip()
+        except:
+            text = ""
+        selector_registry.record(chain, selector, bool(text))
+        if text:
+            return text
+    return ""
+
+
+def find_company_url(driver):
+    """Return the href of the top card's company link, without waiting."""
+    for selector in TOP_CARD_SELECTORS["company"]:
+        for element in driver.find_elements(By.XPATH, selector):
+            href = element.get_attribute("href")
+            if href:
+                return href
+    return ""
+
+
+def extract_top_card_legacy(driver):
+    """Read title, company and location of the selected job, one WebDriverWait per selector."""
+    return {
+        "title": find_first_text(driver, "top_card_title", TOP_CARD_SELECTORS["title"], 2),
+        "company": find_first_text(driver, "top_card_company", TOP_CARD_SELECTORS["company"], 1),
+        "company_url": find_company_url(driver),
+        "location": find_first_text(driver, "top_card_location", TOP_CARD_SELECTORS["location"], 1),
+        "description": None  # read separately, after the stale-job check
+    }
+
+
+def extract_description_legacy(driver):
+    return find_first_text(driver, "top_card_description", TOP_CARD_SELECTORS["description"], 2) or "unknown"
+
+
+def navigate_to_next_page(driver, current_page, max_retries=3, waiter=None):
     """Navigate to the next page with enhanced selector logic."""
+    waiter = waiter or AdaptiveWaiter(driver)
     for attempt in range(max_retries):
         try:
             print(f"🔄 Attempting to navigate to page {current_page + 1} (attempt {attempt + 1}/{max_retries})")
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            waiter.wait_for_dom_idle("pagination_scroll", timeout=2)
 
-            # Enhanced selectors for pagination buttons
+            # Enhanced selectors for pagination buttons ({page} is the page to go to)
             next_button_selectors = [
-                f"//button[@aria-label='Page {current_page + 1}']",
-                f"//li[@data-test-pagination-page-btn='{current_page + 1}']//button",
+                "//button[@aria-label='Page {page}']",
+                "//li[@data-test-pagination-page-btn='{page}']//button",
                 "//button[contains(@aria-label, 'Next')]",
                 "//button[contains(@class, 'artdeco-pagination__button--next')]",
                 "//li[contains(@class, 'artdeco-pagination__indicator--next')]//button",
-                f"//button[text()='{current_page + 1}']",
-                f"//a[text()='{current_page + 1}']"
+                "//button[text()='{page}']",
+                "//a[text()='{page}']"
             ]
 
-            # Try each selector with extended timeout
-            next_button = None
-            for selector in next_button_selectors:
-                try:
-                    next_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector)))
-                    print(f"   ✅ Found next button with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            # Try each selector with extended timeout, historical winner first
+            next_button, selector = selector_registry.wait_for_first(
+                driver, "next_page_button", next_button_selectors, 5, EC.element_to_be_clickable,
+                fmt={"page": current_page + 1})
+            if next_button:
+                print(f"   ✅ Found next button with selector: {selector}")
 
             if not next_button:
                 print(f"   ❌ No next button found on attempt {attempt + 1}")
@@ -600,7 +752,7 @@ def navigate_to_next_page(driver, current_page, max_retries=3):
                                                         "//button[contains(., 'See more jobs')]")))
                         print("   🔄 Found 'See more jobs' button instead")
                         driver.execute_script("arguments[0].click();", see_more)
-                        time.sleep(3)
+                        waiter.wait_for_job_count_stable("page_load", timeout=8)
                         return True
                     except:
                         pass
@@ -608,45 +760,64 @@ def navigate_to_next_page(driver, current_page, max_retries=3):
 
             # Click using JavaScript to avoid interception
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(0.5)
+            waiter.human_pause("pagination_click")
             driver.execute_script("arguments[0].click();", next_button)
-            time.sleep(1.5)
 
             # Verify navigation by checking URL change
             start_param = f"start={current_page * 25}"
-            for _ in range(8):
-                if start_param in driver.current_url:
-                    print(f"   ✅ Successfully navigated to page {current_page + 1}")
-                    time.sleep(random.uniform(2, 4))
-                    return True
-                time.sleep(1)
+            if waiter.wait_for_url_contains("page_navigation", start_param, timeout=9.5):
+                print(f"   ✅ Successfully navigated to page {current_page + 1}")
+                waiter.wait_for_job_count_stable("page_load", timeout=8)
+                return True
 
             print(f"   ⚠️ Page might not have loaded properly")
             return False
 
         except Exception as e:
             print(f"   ❌ Navigation error: {str(e)[:80]}...")
-            time.sleep(3)
+            waiter.human_pause("navigation_retry", 2, 3)
 
     print(f"   ❌ Failed to navigate to page {current_page + 1}")
     return False
 
 
-def scrape_job_listings(driver, page_num=1, job_title=""):
-    """Scrape job listings with enhanced scrolling simulation."""
+def scrape_job_listings(driver, page_num=1, job_title="", summarizer=None, waiter=None,
+                        extraction_mode=TOP_CARD_EXTRACTION_MODE, save_page=True, csv_writer=None,
+                        last_scraping_date=DEFAULT_LAST_SCRAPING_DATE, page_stats=None):
+    """Scrape job listings with enhanced scrolling simulation.
+
+    When a SummarizationPipeline is passed, descriptions are summarized in the background
+    while the next cards are clicked, and summaries are joined back before the page is saved.
+    extraction_mode "snapshot" reads the whole top card with one execute_script call;
+    "legacy" waits on each selector separately. Rows go to csv_writer when one is passed;
+    with save_page=False the caller saves them.
+
+    Jobs posted before last_scraping_date (the search's watermark) are skipped. If a page_stats
+    dict is passed, it receives how many dated jobs on the page were "stale" and "recent", how
+    many job "cards" the page showed and whether scraping the page "failed".
+    """
     jobs = []
+    pending_summaries = []  # (job_data, future) pairs waiting on the summarizer
+    skipped_from_card = 0  # stale jobs rejected from the results list, before clicking
+    skipped_from_top_card = 0  # stale jobs rejected from the top card, before the description
+    skipped_seen = 0  # jobs already scraped on an earlier page, run or search
+    page_job_ids = []  # ids of the jobs kept on this page, marked as seen once saved
+    page_company_slugs = []  # (company, slug) pairs, so stage 2 can open About pages directly
+    if page_stats is None:
+        page_stats = {}
+    page_stats.update({"stale": 0, "recent": 0, "cards": 0, "failed": False})
+    waiter = waiter or AdaptiveWaiter(driver)
     try:
         print(f"📊 Scraping job listings from page {page_num}...")
 
         # Wait for initial load
-        time.sleep(3)
+        waiter.wait_for_job_count_stable("initial_load", timeout=8)
 
         # Get initial job count
         initial_jobs = driver.find_elements(By.XPATH, "//div[contains(@class, 'job-card-container')]")
         print(f"📊 Initial job count on page {page_num}: {len(initial_jobs)}")
 
         # Find the scrollable container
-        scroll_target = None
         scroll_selectors = [
             ".jobs-search-results-list",
             ".scaffold-layout__list",
@@ -655,13 +826,9 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
             ".artdeco-list"
         ]
 
-        for selector in scroll_selectors:
-            try:
-                scroll_target = driver.find_element(By.CSS_SELECTOR, selector)
-                print(f"✅ Found scroll target: {selector}")
-                break
-            except:
-                continue
+        scroll_target, selector = selector_registry.find_in(driver, "scroll_target", scroll_selectors)
+        if scroll_target:
+            print(f"✅ Found scroll target: {selector}")
 
         if not scroll_target:
             print("❌ Could not find scroll target, using body")
@@ -674,7 +841,7 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
         # Focus on the scroll area
         actions = ActionChains(driver)
         actions.move_to_element(scroll_target).perform()
-        time.sleep(0.5)
+        waiter.human_pause("scroll")
 
         max_scroll_attempts = 15  # Increased for more thorough scraping
         jobs_loaded_count = len(initial_jobs)
@@ -688,7 +855,7 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
             driver.execute_script("""
                 arguments[0].scrollTop = arguments[0].scrollHeight;
             """, scroll_target)
-            time.sleep(2)
+            waiter.wait_for_job_count_stable("scroll_load", stable_for=0.5, timeout=3)
 
             # Method 2: Smooth scroll with JavaScript
             driver.execute_script("""
@@ -698,7 +865,7 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                     behavior: 'smooth'
                 });
             """, scroll_target)
-            time.sleep(1.5)
+            waiter.wait_for_dom_idle("scroll_load", timeout=2)
 
             # Method 3: Scroll to last visible job card
             current_jobs = driver.find_elements(By.XPATH, "//div[contains(@class, 'job-card-container')]")
@@ -706,7 +873,7 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                 try:
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});",
                                           current_jobs[-1])
-                    time.sleep(1)
+                    waiter.wait_for_job_count_stable("scroll_load", stable_for=0.5, timeout=2)
                 except:
                     pass
 
@@ -729,13 +896,13 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
 
                     # Scroll with page down key
                     actions.send_keys(Keys.PAGE_DOWN).perform()
-                    time.sleep(1.5)
+                    waiter.wait_for_dom_idle("scroll_load", timeout=2)
 
                     # Aggressive wheel scroll
                     driver.execute_script("""
                         arguments[0].scrollBy(0, 1500);
                     """, scroll_target)
-                    time.sleep(2)
+                    waiter.wait_for_job_count_stable("scroll_load", stable_for=0.5, timeout=3)
 
                     # Check if we've reached the end
                     new_height = driver.execute_script("return arguments[0].scrollHeight", scroll_target)
@@ -755,11 +922,12 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                         break
 
             # Random delay to appear more human-like
-            time.sleep(random.uniform(0.5, 1.5))
+            waiter.human_pause("scroll")
 
         # Final count
         final_jobs = driver.find_elements(By.XPATH, "//div[contains(@class, 'job-card-container')]")
         print(f"\n🎯 Final job count on page {page_num}: {len(final_jobs)} (started with {len(initial_jobs)})")
+        page_stats["cards"] = len(final_jobs)
 
         # Process all the jobs we found - scrape ALL jobs on the page
         print(f"\n🎯 Processing all {len(final_jobs)} jobs on page {page_num}...")
@@ -770,7 +938,7 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
 
                 # Scroll job into view
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", job_card)
-                time.sleep(0.5)
+                waiter.human_pause("card_scroll")
 
                 # Extract job URL from card BEFORE clicking
                 job_url = "URL not found"
@@ -784,85 +952,58 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                         ".//a[contains(@class, 'job-card-container__link')]",  # XPath
                     ]
 
-                    for selector in url_selectors:
+                    for selector in selector_registry.ordered("job_card_url", url_selectors):
                         try:
-                            # Try CSS selector first
-                            if selector.startswith(".") or selector.startswith("a"):
-                                link_element = job_card.find_element(By.CSS_SELECTOR, selector)
-                            else:  # Then try XPath
-                                link_element = job_card.find_element(By.XPATH, selector)
-
-                            href = link_element.get_attribute('href')
-                            if href:
-                                job_url = href
-                                # Handle relative URLs
-                                if job_url.startswith('/'):
-                                    job_url = f"https://www.linkedin.com{job_url}"
-                                break
+                            # XPath selectors start with "./", everything else is CSS
+                            by = By.XPATH if selector.startswith("./") else By.CSS_SELECTOR
+                            links = job_card.find_elements(by, selector)
+                            href = links[0].get_attribute('href') if links else None
                         except:
-                            continue
+                            href = None
+                        selector_registry.record("job_card_url", selector, bool(href))
+                        if href:
+                            job_url = href
+                            # Handle relative URLs
+                            if job_url.startswith('/'):
+                                job_url = f"https://www.linkedin.com{job_url}"
+                            break
                 except Exception as url_error:
                     print(f"⚠️ URL extraction error: {str(url_error)[:80]}...")
 
-                # Click the job using JavaScript
-                driver.execute_script("arguments[0].click();", job_card)
-                time.sleep(1.5)
-
-                # Extract job details
-                title = ""
-                company = ""
-
-                # Get title
-                title_selectors = [
-                    "//h1[contains(@class, 't-24')]"
-                ]
-
-                for selector in title_selectors:
-                    try:
-                        title_element = WebDriverWait(driver, 2).until(
-                            EC.presence_of_element_located((By.XPATH, selector)))
-                        title = title_element.text.strip()
-                        if title:
-                            break
-                    except:
-                        continue
+                # Read the card date first so known jobs still count towards the page's staleness
+                card_posted_on = get_card_posted_date(job_card)
+                card_is_stale = bool(card_posted_on) and not is_job_recent(card_posted_on, last_scraping_date)
+
+                # Skip jobs already scraped on an earlier page, run or search, before clicking.
+                # Without a card date a known job counts as stale: it is nothing new
+                job_id = job_card.get_attribute("data-job-id") or parse_job_id(job_url)
+                if get_seen_jobs_index().is_known(job_id):
+                    skipped_seen += 1
+                    page_stats["recent" if card_posted_on and not card_is_stale else "stale"] += 1
+                    print(f"⏭️ Skipping already scraped job {job_id}")
+                    continue
 
-                # Get company
-                company_selectors = [
-                    "//div[contains(@class, 'jobs-unified-top-card__company-name')]//a"
-                ]
+                # Reject stale jobs straight from the card when it shows a posted date
+                if card_is_stale:
+                    skipped_from_card += 1
+                    page_stats["stale"] += 1
+                    print(f"⏭️ Skipping old job before clicking (posted: {card_posted_on})")
+                    continue
 
-                for selector in company_selectors:
-                    try:
-                        company_element = WebDriverWait(driver, 1).until(
-                            EC.presence_of_element_located((By.XPATH, selector)))
-                        company = company_element.text.strip()
-                        if company:
-                            break
-                    except:
-                        continue
+                # Click the job using JavaScript, then wait for the top card to show it
+                driver.execute_script("arguments[0].click();", job_card)
+                waiter.wait_for_job_selected("job_select", job_id)
+                waiter.human_pause("job_select")
 
-                # Get location - NEW CODE
-                location = "Location not found"
-                location_selectors = [
-                    "//span[contains(@class, 'jobs-unified-top-card__bullet')]",
-                    "//span[contains(@class, 'jobs-unified-top-card__subtitle-item')]",
-                    "//div[contains(@class, 'jobs-unified-top-card__company-name')]/following-sibling::div//li[1]",
-                    "//div[contains(@class, 'jobs-unified-top-card__primary-description')]//span",
-                    "//div[contains(@class, 'job-details-jobs-unified-top-card__primary-description')]//span",
-                    "//span[contains(@class, 'topcard__flavor--bullet')]"
-                ]
-
-                for selector in location_selectors:
-                    try:
-                        location_element = WebDriverWait(driver, 1).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        location = location_element.text.strip()
-                        if location:  # Only break if we got actual text
-                            break
-                    except:
-                        continue
+                # Extract job details
+                if extraction_mode == "snapshot":
+                    # One round trip for every field, fallback selectors tried inside the browser
+                    top_card = extract_top_card_snapshot(driver)
+                else:
+                    top_card = extract_top_card_legacy(driver)
+                title = top_card["title"]
+                company = top_card["company"]
+                location = top_card["location"] or "Location not found"
 
                 # Clean up location text
                 cleaned_location_string = location.replace('\n', ' ').replace('  ', ' ').strip()
@@ -875,31 +1016,18 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                 print(location)
                 print(posted_on)
 
-                # Get job description
-                description = "unknown"
-                description_selectors = [
-                    "//div[contains(@class, 'jobs-description__details')]",
-                    "//div[contains(@class, 'jobs-description-content')]",
-                    "//section[contains(@class, 'jobs-description')]"
-                ]
-
-                for selector in description_selectors:
-                    try:
-                        desc_element = WebDriverWait(driver, 2).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        description = desc_element.text.strip()
-                        if description:
-                            break
-                    except:
-                        continue
-
-                summarized_description = summarize_job_description(description)
-
-                # Filter jobs based on posted_on date
+                # Filter jobs based on posted_on date before paying for the description and LLM call
                 if not is_job_recent(posted_on + " UTC", last_scraping_date):
+                    skipped_from_top_card += 1
+                    page_stats["stale"] += 1
                     print(f"⏭️ Skipping old job: {title} (posted: {posted_on})")
                     continue
+                page_stats["recent"] += 1
+
+                # Get job description
+                description = top_card.get("description")
+                if description is None:
+                    description = extract_description_legacy(driver)
 
                 if title:
                     job_data = {
@@ -907,15 +1035,22 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                         "company": company if company else "Company not found",
                         "location": location,
                         "url": job_url,
-                        "job_description": summarized_description,
+                        "job_description": None,  # filled in once the summary is ready
                         "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
                         "posted_on": posted_on + " UTC"
                     }
 
-                    jobs.append(job_data)
+                    if summarizer:
+                        # Hand off to the worker stage and keep clicking
+                        pending_summaries.append((job_data, summarizer.submit(description)))
+                    else:
+                        job_data["job_description"] = summarize_job_description(description)
 
-                    # Save immediately to CSV
-                    save_to_csv([job_data], job_title, append=(len(jobs) > 1))
+                    jobs.append(job_data)
+                    page_job_ids.append(job_id)
+                    company_slug = parse_company_slug(top_card.get("company_url"))
+                    if company and company_slug:
+                        page_company_slugs.append((company, company_slug))
 
                     print(f"✅ {title} at {company if company else 'Unknown'} in {location}")
                 else:
@@ -926,20 +1061,89 @@ def scrape_job_listings(driver, page_num=1, job_title=""):
                 continue
 
         print(f"\n📋 Page {page_num} Summary: Successfully scraped {len(jobs)} jobs")
+        print(f"💸 Old jobs skipped: {skipped_from_card} before clicking, {skipped_from_top_card} before description "
+              f"- {skipped_from_card + skipped_from_top_card} LLM calls avoided")
+        print(f"♻️ Already scraped jobs skipped: {skipped_seen}")
         return jobs
 
     except Exception as e:
         print(f"❌ Scraping failed on page {page_num}: {e}")
+        page_stats["failed"] = True
         import traceback
         traceback.print_exc()
         return jobs
 
+    finally:
+        # Join summaries back to their rows, then save the page in one write
+        if pending_summaries:
+            print(f"⏳ Waiting for {len(pending_summaries)} job summaries on page {page_num}...")
+        for job_data, future in pending_summaries:
+            try:
+                job_data["job_description"] = future.result()
+            except Exception as summary_error:
+                job_data["job_description"] = f"API Error: {str(summary_error)}"
+        if jobs and save_page:
+            if csv_writer:
+                csv_writer.write_rows(jobs)
+                # Rows must be on disk before their ids are marked seen, or a crash loses them
+                csv_writer.flush()
+            else:
+                save_to_csv(jobs, job_title, append=(page_num > 1))
+            get_seen_jobs_index().mark_seen(page_job_ids, job_title)
+        get_company_slug_cache().remember_many(page_company_slugs, source="job_card")
+
+
+def with_date_sort(search_url):
+    """Return search_url with LinkedIn's "Most recent" ordering (sortBy=DD)."""
+    parts = urlparse(search_url)
+    query = parse_qs(parts.query)
+    query["sortBy"] = ["DD"]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
+def sort_results_by_date(driver, waiter=None):
+    """Reload the current results list ordered newest first, unless it already is."""
+    if "sortBy=DD" in driver.current_url:
+        return
+    print("🔃 Sorting results by most recent")
+    driver.get(with_date_sort(driver.current_url))
+    waiter = waiter or AdaptiveWaiter(driver)
+    waiter.wait_for_job_count_stable("sort_results")
+
+
+def is_page_stale(page_stats, stale_fraction=STALE_PAGE_FRACTION):
+    """True if at least stale_fraction of the dated jobs on a page are older than the watermark.
+    Already scraped jobs without a card date are counted as stale by scrape_job_listings."""
+    dated = page_stats.get("stale", 0) + page_stats.get("recent", 0)
+    return dated > 0 and page_stats["stale"] / dated >= stale_fraction
+
+
+def is_first_page_usable(page_stats):
+    """False if page 1 raised or showed no job cards, i.e. the search itself did not load."""
+    return not page_stats.get("failed") and page_stats.get("cards", 0) > 0
+
 
-def scrape_all_pages(driver, JOB_TITLE, max_pages_scraped):
-    """Scrape jobs from all available pages."""
+def scrape_all_pages(driver, JOB_TITLE, max_pages_scraped, summarizer=None, csv_writer=None,
+                     last_scraping_date=DEFAULT_LAST_SCRAPING_DATE, stop_when_stale=STOP_WHEN_STALE,
+                     stale_fraction=STALE_PAGE_FRACTION, pagination=None):
+    """Scrape jobs from all available pages.
+
+    With stop_when_stale (results sorted newest first), pagination ends on the first page where
+    at least stale_fraction of the dated jobs are older than last_scraping_date.
+
+    If a pagination dict is passed, its "complete" is True only when pagination reached a stale
+    page or the last page, with every page scraped without error - i.e. no job newer than
+    last_scraping_date can be left on a page that was never visited.
+    """
+    if pagination is None:
+        pagination = {}
+    pagination["complete"] = False
+    reached_end = False
+    page_failed = False
     all_jobs = []
     current_page = 1
     max_pages_scraped = max_pages_scraped
+    waiter = AdaptiveWaiter(driver)
 
     print("\n" + "=" * 60)
     print("🚀 STARTING MULTI-PAGE SCRAPING")
@@ -961,40 +1165,64 @@ def scrape_all_pages(driver, JOB_TITLE, max_pages_scraped):
             print(f"📄 Processing page {current_page}")
 
         # Scrape current page
-        page_jobs = scrape_job_listings(driver, current_page, JOB_TITLE)
+        page_start = time.time()
+        page_stats = {}
+        page_jobs = scrape_job_listings(driver, current_page, JOB_TITLE, summarizer, waiter, csv_writer=csv_writer,
+                                        last_scraping_date=last_scraping_date, page_stats=page_stats)
+        page_failed = page_failed or page_stats["failed"]
+        if current_page == 1 and not is_first_page_usable(page_stats):
+            print("❌ First page failed or showed no jobs. Stopping.")
+            break
 
         if page_jobs:
             all_jobs.extend(page_jobs)
             print(f"✅ Added {len(page_jobs)} jobs from page {current_page}")
             print(f"📊 Total jobs collected so far: {len(all_jobs)}")
         else:
-            print(f"⚠️ No jobs found on page {current_page}")
-            if current_page == 1:
-                print("❌ No jobs found on first page. Stopping.")
-                break
+            # Page loaded but every job was already seen or old - newer jobs may still be further on
+            print(f"⚠️ No new jobs on page {current_page}")
+
+        # This page is (mostly) older than the watermark - later pages are older still
+        if stop_when_stale and is_page_stale(page_stats, stale_fraction):
+            print(f"🛑 {page_stats['stale']} of {page_stats['stale'] + page_stats['recent']} dated jobs on page "
+                  f"{current_page} are older than {last_scraping_date} - stopping pagination")
+            waiter.report(f"for page {current_page}", elapsed=time.time() - page_start)
+            current_page += 1
+            reached_end = True
+            break
 
         # Try to navigate to next page
         print(f"\n🔄 Attempting to navigate from page {current_page} to page {current_page + 1}...")
 
-        if navigate_to_next_page(driver, current_page):
+        navigated = navigate_to_next_page(driver, current_page, waiter=waiter)
+        waiter.report(f"for page {current_page}", elapsed=time.time() - page_start)
+        if navigated:
             current_page += 1
             print(f"✅ Successfully moved to page {current_page}")
         else:
             print(f"🔚 No more pages available after page {current_page}")
+            reached_end = True
             break
 
         # Extra safety delay between pages
-        extra_delay = random.uniform(1, 3)
-        print(f"⏱️ Extra safety delay: {extra_delay:.1f} seconds")
-        time.sleep(extra_delay)
+        waiter.human_pause("page_delay", 1, 3)
 
     print(f"\n🎉 SCRAPING COMPLETE!")
     print(f"📊 Total pages processed: {current_page - 1}")
+    if current_page - 1 < max_pages_scraped:
+        print(f"⏱️ Pages saved vs max_pages_scraped={max_pages_scraped}: {max_pages_scraped - (current_page - 1)}")
     print(f"📊 Total jobs collected: {len(all_jobs)}")
 
+    pagination["complete"] = reached_end and not page_failed
+    if not pagination["complete"]:
+        print("⚠️ Pagination did not reach a stale page or the last page - watermark stays where it was")
     return all_jobs
 
 
+def get_jobs_csv_path(JOB_TITLE):
+    return f"scraped_data/1_get_company_names/linkedin_{JOB_TITLE}_jobs.csv"
+
+
 def save_to_csv(jobs, JOB_TITLE, filename=None, append=False):
     """Save jobs data to CSV file."""
     if not jobs:
@@ -1002,16 +1230,13 @@ def save_to_csv(jobs, JOB_TITLE, filename=None, append=False):
         return
 
     if not filename:
-        folder_name = "scraped_data/1_get_company_names"
-        if not os.path.exists(folder_name):
-            os.makedirs(folder_name, exist_ok=True)
-        filename = f"{folder_name}/linkedin_{JOB_TITLE}_jobs.csv"
+        filename = get_jobs_csv_path(JOB_TITLE)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
 
     try:
         mode = 'a' if append else 'w'
         with open(filename, mode, newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'company', 'location', 'url', 'job_description', 'scraped_at', 'posted_on']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=JOB_FIELDNAMES)
 
            # Write header only if it's a new file
             if not append:
@@ -1027,7 +1252,22 @@ def save_to_csv(jobs, JOB_TITLE, filename=None, append=False):
     except Exception as e:
         print(f"❌ Error saving to CSV: {e}")
 
+def get_search_filters(DATE_POSTED, INDUSTRY_FILTER, EXPERIENCE_LEVEL_FILTER):
+    """Filter set a watermark is kept for."""
+    return {"date_posted": DATE_POSTED, "industry": INDUSTRY_FILTER or [], "experience_level": EXPERIENCE_LEVEL_FILTER or []}
+
+
+def next_watermark(run_started_at):
+    """Watermark to store after a successful run that started at run_started_at (UTC)."""
+    return (run_started_at - timedelta(hours=WATERMARK_OVERLAP_HOURS)).strftime('%Y-%m-%d %H:%M')
+
+
 def get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER, max_pages_scraped, EXPERIENCE_LEVEL_FILTER):
+    csv_writer = None
+    run_completed = False
+    run_started_at = datetime.utcnow()
+    metadata_store = MetadataStore(METADATA_DB_PATH)
+    search_filters = get_search_filters(DATE_POSTED, INDUSTRY_FILTER, EXPERIENCE_LEVEL_FILTER)
     try:
 
         print("🚀 Starting LinkedIn Job Scraper with Pagination...")
@@ -1035,6 +1275,9 @@ def get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER,
         print(f"📍 Location: {LOCATION}")
         print(f"📅 Date filter: {DATE_POSTED}")
         print(f"Industry filter: {INDUSTRY_FILTER}")
+        last_scraping_date = metadata_store.get_watermark(JOB_TITLE, LOCATION, search_filters,
+                                                          default=DEFAULT_LAST_SCRAPING_DATE)
+        print(f"🕒 Watermark: only jobs posted after {last_scraping_date} UTC")
         print("-" * 50)
 
         time.sleep(2)
@@ -1042,12 +1285,33 @@ def get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER,
         if not apply_job_filters(driver, JOB_TITLE, LOCATION, DATE_POSTED, INDUSTRY_FILTER, EXPERIENCE_LEVEL_FILTER):
             print("❌ Filter application failed. Exiting...")
             return
-
-        # Scrape all pages
-        all_jobs = scrape_all_pages(driver, JOB_TITLE, max_pages_scraped)
-
-        # Save all jobs to single CSV
-        save_to_csv(all_jobs, JOB_TITLE)
+        if STOP_WHEN_STALE:
+            sort_results_by_date(driver)
+
+        # Rows are appended as each page finishes; an interrupted previous run is resumed
+        csv_writer = JobCsvWriter(get_jobs_csv_path(JOB_TITLE)).open()
+
+        # Scrape all pages, summarizing descriptions in a background worker stage
+        pagination = {}
+        with SummarizationPipeline(summarize_job_description, SUMMARY_MAX_WORKERS, SUMMARY_QUEUE_SIZE) as summarizer:
+            all_jobs = scrape_all_pages(driver, JOB_TITLE, max_pages_scraped, summarizer, csv_writer,
+                                        last_scraping_date, pagination=pagination)
+        run_completed = True
+
+        # Only a run that saw every page newer than the watermark moves it forward
+        if pagination["complete"]:
+            metadata_store.set_watermark(JOB_TITLE, LOCATION, search_filters, next_watermark(run_started_at))
+
+        print(f"✅ Data saved to {csv_writer.path}")
+        print(f"📊 Records written this run: {csv_writer.rows_written} "
+              f"({csv_writer.duplicates_skipped} already saved rows skipped)")
+        print(f"♻️ Known jobs skipped before clicking: {get_seen_jobs_index().skipped}")
+
+        if summary_cache:
+            cache_stats = summary_cache.stats()
+            print(f"🗄️ Summary cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.0%} hit rate), {cache_stats['entries']} entries, "
+                  f"{cache_stats['evictions']} evicted")
 
         # Print final results
         print("\n" + "=" * 60)
@@ -1082,6 +1346,13 @@ def get_company_names(driver, LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER,
         import traceback
         traceback.print_exc()
     finally:
+        if csv_writer:
+            csv_writer.close(completed=run_completed)
+        metadata_store.close()
+        try:
+            selector_registry.save()
+        except Exception as e:
+            print(f"⚠️ Could not save selector stats: {e}")
         print("\n🔚 Part 1: Scrape new jobs COMPLETE...")
 
 
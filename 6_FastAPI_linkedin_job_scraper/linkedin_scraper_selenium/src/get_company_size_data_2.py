@@ -1,7 +1,9 @@
 import os
 import csv
 import json
+import queue
 import random
+import threading
 import time
 from dotenv import load_dotenv
 from selenium import webdriver
@@ -12,12 +14,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (TimeoutException,
                                         NoSuchElementException)
 
+from src.rate_limiter import RateLimiter
+from src.progress_journal import ProgressJournal
+from src.about_parser import read_about_section, parse_about_text
+from src.input_strategies import type_text, report_input_stats, INPUT_STRATEGY_COMPANY_SEARCH
+from src.company_slug_cache import get_company_slug_cache, parse_company_slug, company_about_url
+from src.company_cache import get_company_cache, COMPANY_CACHE_MODE, COMPANY_FIELDS
+
 # Constants
 OUTPUT_DIR = "./scraped_data/2_get_company_size_data"
 
 # Initialize data structures
 processed_companies = set()
 company_data = {}  # {company_name: {website, industry, company_size}}
+progress_lock = threading.Lock()  # guards the two above when several browsers run
+captcha_lock = threading.Lock()  # one manual CAPTCHA prompt at a time
+
+# Finished companies, one JSON line each; replayed after a crash and removed after a successful run
+progress_journal = ProgressJournal(f"{OUTPUT_DIR}/progress.jsonl",
+                                   compact_every=int(os.getenv("PROGRESS_COMPACT_EVERY", "200")))
+
+# Company lookups started per minute across all browsers (replaces the per-loop pauses)
+COMPANY_LOOKUPS_PER_MINUTE = float(os.getenv("COMPANY_LOOKUPS_PER_MINUTE", "4"))
+COMPANY_LOOKUP_JITTER = float(os.getenv("COMPANY_LOOKUP_JITTER", "3"))
 
 # Load environment variables
 load_dotenv()
@@ -34,80 +53,41 @@ def extract_website_and_company_size_info(about_section_text):
         about_section_text (str): The input text containing company information
 
     Returns:
-        tuple: (website, company_size) - extracted information or "unknown" if not found
+        tuple: (website, industry, company_size) - extracted information or "unknown" if not found
     """
-    lines = about_section_text.split('\n')
-    website = "unknown"
-    industry = "unknown"
-    company_size = "unknown"
-
-    for i, line in enumerate(lines):
-        line = line.strip()
-
-        # Check for Website keyword
-        if line == "Website":
-            # Check if next line exists and contains "www"
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if "www" in next_line or "http" in next_line:
-                    website = next_line
-
-        if line == "Industry":
-            # Check if previous, previous  line contains "Verified page"
-            next_line = lines[i + 1].strip()
-            next_to_next_line = lines[i + 2].strip()
-            if "Company size" in next_to_next_line:
-                industry = next_line
-
-        # Check for Company size keyword
-        if line == "Company size":
-            # Check if next line exists and contains "employees"
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if "employees" in next_line:
-                    company_size = next_line
-
-    return website, industry, company_size
-
-
-def save_progress():
-    """Save current progress to file"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    progress_file = f"{OUTPUT_DIR}/progress.json"
+    return parse_about_text(about_section_text)
 
-    progress_data = {
-        'processed': list(processed_companies),
-        'company_data': company_data
-    }
-    with open(progress_file, 'w') as f:
-        json.dump(progress_data, f, indent=2)
+
+def save_progress(company_name):
+    """Append one finished company to the progress journal (constant time, crash-safe)"""
+    progress_journal.append(company_name, company_data[company_name])
 
 
 def load_progress():
-    """Load progress from file if exists"""
+    """Replay the progress journal (or a legacy progress.json) if one exists"""
     global processed_companies, company_data
 
-    progress_file = f"{OUTPUT_DIR}/progress.json"
-    if not os.path.exists(progress_file):
-        return
-
-    try:
-        with open(progress_file, 'r') as f:
-            progress_data = json.load(f)
+    entries = progress_journal.replay()
 
-        processed_companies = set(progress_data.get('processed', []))
-        company_data = progress_data.get('company_data', {})
+    legacy_progress_file = f"{OUTPUT_DIR}/progress.json"
+    if os.path.exists(legacy_progress_file):
+        try:
+            with open(legacy_progress_file, 'r') as f:
+                progress_data = json.load(f)
+            for name, data in progress_data.get('company_data', {}).items():
+                entries.setdefault(name, data)
+            progress_journal.compact()
+        except json.JSONDecodeError:
+            print("Legacy progress file corrupted, ignoring it")
+        os.remove(legacy_progress_file)
 
-    except json.JSONDecodeError:
-        print("Progress file corrupted, starting fresh")
+    company_data = dict(entries)
+    processed_companies = set(entries)
 
 
-def human_type(element, text):
-    """Type text with human-like delays"""
-    for char in text:
-        element.send_keys(char)
-        time.sleep(random.uniform(0.05, 0.2))
-    time.sleep(0.5)
+def human_type(element, text, strategy="human"):
+    """Type text with human-like delays (or another strategy from src.input_strategies)"""
+    type_text(element, text, strategy)
 
 
 def random_delay(min=1, max=3):
@@ -121,58 +101,97 @@ def handle_captcha():
     input("Press ENTER to continue after solving CAPTCHA...")
 
 
+def open_about_page_via_search(driver, company_name):
+    """Reach the company's About tab through the global search box (several page loads).
+    Returns the company slug found on the way, if any."""
+    # Search for company
+    try:
+        search_box = WebDriverWait(driver, 20).until(
+            EC.element_to_be_clickable((By.XPATH, "//input[contains(@aria-label, 'Search')]")))
+        search_box.clear()
+        human_type(search_box, company_name, INPUT_STRATEGY_COMPANY_SEARCH)
+        search_box.send_keys(Keys.RETURN)
+        random_delay(2, 4)
+    except Exception as e:
+        print(f"Search failed for {company_name}")
+        raise
+
+    # Apply company filter
+    try:
+        company_filter = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[text()='Companies']")))
+        company_filter.click()
+        random_delay(1, 2)
+    except Exception:
+        print("Company filter not found, proceeding with results")
+
+    # Open first result
+    try:
+        first_result = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[contains(@href,'/company/')]")))
+        slug = parse_company_slug(first_result.get_attribute("href"))
+        first_result.click()
+        random_delay(2, 3)
+    except Exception as e:
+        print(f"No company results found for {company_name}")
+        raise
+
+    # Go to About tab
+    try:
+        about_tab = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[contains(@href,'/about/')]")))
+        about_tab.click()
+        random_delay(2, 3)
+    except Exception as e:
+        print(f"About tab not found for {company_name}")
+        raise
+
+    return parse_company_slug(driver.current_url) or slug
+
+
+def wait_for_about_section(driver, timeout=10):
+    return WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.XPATH, "//section[contains(@class,'about')]")))
+
+
 def process_company(driver, company_name):
     """Process a single company to extract website and size"""
+    used_search = False
     try:
         print(f"Processing: {company_name}")
 
-        # Search for company
-        try:
-            search_box = WebDriverWait(driver, 20).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[contains(@aria-label, 'Search')]")))
-            search_box.clear()
-            human_type(search_box, company_name)
-            search_box.send_keys(Keys.RETURN)
-            random_delay(2, 4)
-        except Exception as e:
-            print(f"Search failed for {company_name}")
-            raise
-
-        # Apply company filter
-        try:
-            company_filter = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[text()='Companies']")))
-            company_filter.click()
-            random_delay(1, 2)
-        except Exception:
-            print("Company filter not found, proceeding with results")
-
-        # Open first result
-        try:
-            first_result = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(@href,'/company/')]")))
-            first_result.click()
-            random_delay(2, 3)
-        except Exception as e:
-            print(f"No company results found for {company_name}")
-            raise
-
-        # Go to About tab
-        try:
-            about_tab = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(@href,'/about/')]")))
-            about_tab.click()
-            random_delay(2, 3)
-        except Exception as e:
-            print(f"About tab not found for {company_name}")
-            raise
+        # Known slug: one page load straight to the About page, search only on a miss
+        about_section = None
+        slug = get_company_slug_cache().get(company_name)
+        if slug:
+            try:
+                driver.get(company_about_url(slug))
+                about_section = wait_for_about_section(driver)
+                random_delay(1, 2)
+            except Exception:
+                print(f"Cached company page /company/{slug}/ not usable, falling back to search")
+                get_company_slug_cache().forget(company_name)
+
+        if about_section is None:
+            used_search = True
+            if slug:
+                driver.get("https://www.linkedin.com/feed/")
+                random_delay(1, 2)
+            slug = open_about_page_via_search(driver, company_name)
+            if slug:
+                get_company_slug_cache().remember(company_name, slug, source="search")
 
         # Print all About section data
         try:
-            about_section = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//section[contains(@class,'about')]")))
+            if about_section is None:
+                about_section = wait_for_about_section(driver)
 
-            website, industry, company_size = extract_website_and_company_size_info(about_section.text)
+            # dt/dd pairs and JSON-LD in one round trip, text scan only for missing fields
+            try:
+                about = read_about_section(driver)
+                website, industry, company_size = about['website'], about['industry'], about['company_size']
+            except Exception:
+                website, industry, company_size = extract_website_and_company_size_info(about_section.text)
             print("------------------")
             print(website)
             print(industry)
@@ -183,40 +202,94 @@ def process_company(driver, company_name):
             print(f"Could not extract full About section")
             website, industry, company_size = "unknown", "unknown", "unknown"
 
-        # Store company data
-        company_data[company_name] = {
-            'website': website,
-            'industry': industry,
-            'company_size': company_size
-        }
-
-        # Mark as processed
-        processed_companies.add(company_name)
-        save_progress()
+        # Store company data and mark as processed
+        with progress_lock:
+            company_data[company_name] = {
+                'website': website,
+                'industry': industry,
+                'company_size': company_size
+            }
+            processed_companies.add(company_name)
+            save_progress(company_name)
+        get_company_cache().put(company_name, company_data[company_name], slug)
 
     except Exception as e:
         print(f"Error processing {company_name}: {str(e)}")
-        company_data[company_name] = {
-            'website': "unknown",
-            'industry': "unknown",
-            'company_size': "unknown"
-        }
-        processed_companies.add(company_name)
-        save_progress()
+        with progress_lock:
+            company_data[company_name] = {
+                'website': "unknown",
+                'industry': "unknown",
+                'company_size': "unknown"
+            }
+            processed_companies.add(company_name)
+            save_progress(company_name)
         raise
     finally:
-        # Return to home page
+        # Return to home page, where the search box is, after a search-based lookup
+        if used_search:
+            try:
+                driver.get("https://www.linkedin.com/feed/")
+                random_delay(2, 4)
+            except Exception:
+                pass
+
+
+def save_company_csv(JOB_TITLE):
+    """Write company_data to the stage 2 output CSV and return its path."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output_csv = f"{OUTPUT_DIR}/{JOB_TITLE}_company_website_industry_size.csv"
+    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+        fieldnames = ['company', 'website', 'industry', 'company_size']
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+
+        for company_name, data in company_data.items():
+            writer.writerow({
+                'company': company_name,
+                'website': data['website'],
+                'industry': data['industry'],
+                'company_size': data['company_size']
+            })
+    return output_csv
+
+
+def company_worker(worker_id, driver, company_queue, limiter, total_companies):
+    """Pull company names off the shared queue until it is empty."""
+    while True:
+        try:
+            idx, company = company_queue.get_nowait()
+        except queue.Empty:
+            return
+        limiter.acquire()
+        print(f"\n[Browser {worker_id}] Processing {idx}/{total_companies}: {company}")
         try:
-            driver.get("https://www.linkedin.com/feed/")
-            random_delay(2, 4)
-        except Exception:
-            pass
+            process_company(driver, company)
+        except Exception as e:
+            print(f"Failed to process {company}: {str(e)}")
+            if "CAPTCHA" in str(e) or "bot" in str(e).lower():
+                with captcha_lock:
+                    handle_captcha()
+                # Try the same company again after CAPTCHA
+                try:
+                    print(f"Retrying {company} after CAPTCHA")
+                    process_company(driver, company)
+                except Exception as e:
+                    print(f"Still failing after CAPTCHA: {str(e)}")
+
 
+def scrape_company_data(driver, JOB_TITLE, csv_file_path, quit_driver=True, session_pool=None, num_workers=1):
+    """Main function to scrape company data
 
-def scrape_company_data(driver, JOB_TITLE, csv_file_path):
-    """Main function to scrape company data"""
+    Args:
+        quit_driver (bool): Quit the driver when done; pass False when the driver is
+            borrowed from a SessionPool
+        session_pool (SessionPool): Source of extra logged-in browsers for num_workers > 1
+        num_workers (int): Browsers looking up companies at the same time; the total
+            lookup rate stays at COMPANY_LOOKUPS_PER_MINUTE
+    """
     # Load any existing progress
     load_progress()
+    extra_drivers = []
 
     try:
         # Read company names from CSV
@@ -230,63 +303,68 @@ def scrape_company_data(driver, JOB_TITLE, csv_file_path):
 
         # Filter out already processed companies
         companies_to_process = [c for c in companies if c not in processed_companies]
+
+        # Companies looked up within the cache TTL (by any run or job title) are not scraped again
+        if COMPANY_CACHE_MODE == "refresh_stale":
+            cached_companies = 0
+            for company in companies_to_process:
+                cached = get_company_cache().get_fresh(company)
+                if cached:
+                    company_data[company] = {field: cached[field] for field in COMPANY_FIELDS}
+                    processed_companies.add(company)
+                    cached_companies += 1
+            companies_to_process = [c for c in companies_to_process if c not in processed_companies]
+            print(f"{cached_companies} companies taken from the company cache")
         total_companies = len(companies_to_process)
 
         if not total_companies:
             print("All companies already processed.")
+            save_company_csv(JOB_TITLE)
             return
 
         print(f"Found {total_companies} companies to process")
 
-        # Process companies
+        # Process companies: every browser pulls from one queue, paced by one shared limiter
+        company_queue = queue.Queue()
         for idx, company in enumerate(companies_to_process, 1):
-            print(f"\nProcessing {idx}/{total_companies}: {company}")
-            try:
-                process_company(driver, company)
-            except Exception as e:
-                print(f"Failed to process {company}: {str(e)}")
-                if "CAPTCHA" in str(e) or "bot" in str(e).lower():
-                    handle_captcha()
-                    # Try the same company again after CAPTCHA
-                    try:
-                        print(f"Retrying {company} after CAPTCHA")
-                        process_company(driver, company)
-                    except Exception as e:
-                        print(f"Still failing after CAPTCHA: {str(e)}")
-                        continue
-
-            # Periodic longer break
-            if idx % 5 == 0:
-                pause_time = random.uniform(15, 25)
-                print(f"Taking a longer break for {pause_time:.1f} seconds...")
-                time.sleep(pause_time)
-            else:
-                random_delay(1, 3)
+            company_queue.put((idx, company))
+        limiter = RateLimiter(COMPANY_LOOKUPS_PER_MINUTE, jitter=COMPANY_LOOKUP_JITTER)
+
+        drivers = [driver]
+        if session_pool and num_workers > 1:
+            for _ in range(min(num_workers, total_companies, session_pool.size) - 1):
+                try:
+                    extra_drivers.append(session_pool.acquire("part 2"))
+                except Exception as e:
+                    print(f"Could not start another browser: {str(e)}")
+                    break
+            drivers += extra_drivers
+        if len(drivers) > 1:
+            print(f"Using {len(drivers)} browsers")
+
+        threads = [threading.Thread(target=company_worker, args=(worker_id, worker_driver, company_queue, limiter,
+                                                                 total_companies), daemon=True)
+                   for worker_id, worker_driver in enumerate(drivers, 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(f"Rate limiter: {limiter.acquired} lookups, {limiter.waited:.0f}s spent waiting for a slot")
+        report_input_stats()
 
         # Save final CSV results
-        output_csv = f"{OUTPUT_DIR}/{JOB_TITLE}_company_website_industry_size.csv"
-        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['company', 'website', 'industry', 'company_size']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for company_name, data in company_data.items():
-                writer.writerow({
-                    'company': company_name,
-                    'website': data['website'],
-                    'industry': data['industry'],
-                    'company_size': data['company_size']
-                })
-
+        output_csv = save_company_csv(JOB_TITLE)
         print(f"\nProcessing complete. Results saved to {output_csv}")
 
-        # Clean up progress file after successful completion
-        progress_file = f"{OUTPUT_DIR}/progress.json"
-        if os.path.exists(progress_file):
-            os.remove(progress_file)
+        # Clean up progress journal after successful completion
+        progress_journal.remove()
 
     finally:
-        driver.quit()
+        progress_journal.close()
+        for extra_driver in extra_drivers:
+            session_pool.release(extra_driver)
+        if quit_driver:
+            driver.quit()
 
 
 # This allows the script to be run directly if needed
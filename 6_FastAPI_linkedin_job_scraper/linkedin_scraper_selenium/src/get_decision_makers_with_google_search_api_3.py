@@ -1,18 +1,26 @@
+import asyncio
 import json
 import os
+import threading
 import time
-import random
 import pandas as pd
-from datetime import datetime, timedelta
-import requests
 from dotenv import load_dotenv
 import re
 from urllib.parse import quote_plus, urljoin
 import logging
+from collections import Counter, deque
+
+from src.google_search_client import AsyncGoogleSearchClient
+from src.search_quota import quota_day, next_quota_reset, print_quota_plan
+from src.search_result_cache import get_search_result_cache, SEARCH_CACHE_OFFLINE
+from src.query_planner import TitleHitRates, TARGET_CONTACTS_PER_COMPANY
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Companies searched at the same time; request concurrency is capped by the search client
+SEARCH_COMPANY_CONCURRENCY = int(os.getenv("SEARCH_COMPANY_CONCURRENCY", "8"))
+
 # Industry-specific decision maker titles
 DECISION_MAKER_TITLES = {
     "IT Services and IT Consulting": [
@@ -64,6 +72,7 @@ DECISION_MAKER_TITLES = {
         "Managing Director"
     ]
 }
+ALL_DECISION_MAKER_TITLES = {title for titles in DECISION_MAKER_TITLES.values() for title in titles}
 
 # Former position keywords to filter out
 FORMER_KEYWORDS = ["ex-", "former", "previous", "past", "retired", "formerly", "student", "intern", "freelance"]
@@ -205,8 +214,6 @@ async def scrape_decision_makers_google_api(JOB_TITLE, LINKEDIN_COMPANY_SIZE_FIL
         return {}
 
     print(f"Company size filter: {size_filter}")
-    SEARCH_DELAY_MIN = 2
-    SEARCH_DELAY_MAX = 5
     DAILY_LIMIT = 100
     WARNING_THRESHOLD = 70
 
@@ -243,150 +250,306 @@ async def scrape_decision_makers_google_api(JOB_TITLE, LINKEDIN_COMPANY_SIZE_FIL
     progress_data = load_progress(PROGRESS_FILE)
     final_results = load_progress(OUTPUT_FILE)
 
-    api_manager = GoogleAPIManager(api_csv_path, DAILY_LIMIT, WARNING_THRESHOLD)
-
-    try:
-        for idx, row in filtered_companies.iterrows():
-            company_name = row['company']
-            industry = row['industry']
-
-            print(f"\nProcessing company {idx + 1}/{len(filtered_companies)}: {company_name}")
-            print(f"Industry: {industry}")
-
-            if company_name in final_results:
-                print(f"Company {company_name} already processed, skipping...")
-                continue
-
-            # Get industry-specific decision maker titles instead of using the passed parameter
-            company_decision_maker_titles = get_industry_specific_titles(industry)
-            print(
-                f"Using {len(company_decision_maker_titles)} industry-specific titles: {company_decision_maker_titles}")
-
-            company_decision_makers = {}
-            already_found_names = []
-
-            for title_idx, title in enumerate(company_decision_maker_titles):
-                print(f"  Searching for {title} at {company_name}")
-
-                progress_key = f"{company_name}_{title}"
-
-                if progress_key in progress_data:
-                    print(f"    Already processed {title} for {company_name}")
-                    for person_data in progress_data[progress_key]:
-                        name = person_data.get('name')
-                        if name and name not in already_found_names:
-                            company_decision_makers[name] = {
-                                'job_title': person_data.get('job_title'),
-                                'linkedin_url': person_data.get('linkedin_url')
-                            }
-                            already_found_names.append(name)
-                    continue
-
-                if not api_manager.can_make_request():
-                    print("All API keys have hit their daily limits. Queuing for next day...")
-                    print("Please run this script tomorrow to continue processing.")
-                    break
+    def industry_key(industry):
+        return industry if isinstance(industry, str) and industry.strip() else "unknown"
 
-                search_results = search_linkedin_profiles_google_api(
-                    api_manager, title, company_name, max_results_per_search, company_decision_maker_titles,
-                    already_found_names
-                )
+    # Titles are searched best first, by how often they found someone in this industry before
+    company_industries = {row['company']: industry_key(row['industry']) for _, row in df.iterrows()}
+    hit_rates = TitleHitRates.learn(progress_data, company_industries, ALL_DECISION_MAKER_TITLES)
+    planner_stats = {"titles_skipped": 0}
 
-                print(f"    DEBUG: search_results length: {len(search_results)}")
-                for i, result in enumerate(search_results):
-                    print(f"    DEBUG: Result {i}: {result}")
-
-                if not search_results:
-                    print(f"    No relevant LinkedIn profiles found for {title} at {company_name}")
-                    progress_data[progress_key] = []
-                    save_progress(PROGRESS_FILE, progress_data)
-                    continue
+    api_manager = GoogleAPIManager(api_csv_path, DAILY_LIMIT, WARNING_THRESHOLD)
+    total_companies = len(filtered_companies)
+
+    async def search_title(client, company_name, industry, title, company_decision_maker_titles,
+                           already_found_names):
+        """Profiles found for one title: from progress if already searched, else from the API.
+        People in already_found_names (found under the company's earlier titles) are skipped.
+        Returns None if the title could not be searched (no quota left)."""
+        progress_key = f"{company_name}_{title}"
+        if progress_key in progress_data:
+            print(f"    Already processed {title} for {company_name}")
+            return progress_data[progress_key]
+
+        if not api_manager.can_make_request():
+            return None
 
-                processed_profiles = []
-                for result_data in search_results:
-                    person_name = result_data['name']
-                    if person_name not in already_found_names:
-                        # Add industry information to result
-                        result_data['industry'] = industry
-                        processed_profiles.append(result_data)
-                        company_decision_makers[person_name] = {
-                            'job_title': result_data['job_title'],
-                            'linkedin_url': result_data['linkedin_url']
-                        }
-                        already_found_names.append(person_name)
-                        print(f"      Found: {person_name} - {result_data['job_title']}")
-
-                print(f"    DEBUG: processed_profiles length: {len(processed_profiles)}")
-                progress_data[progress_key] = processed_profiles
-                save_progress(PROGRESS_FILE, progress_data)
-
-                delay = random.uniform(SEARCH_DELAY_MIN, SEARCH_DELAY_MAX)
-                print(f"    Waiting {delay:.1f} seconds...")
-                time.sleep(delay)
-
-            final_results[company_name] = company_decision_makers
-            save_progress(OUTPUT_FILE, final_results)
-
-            print(f"  Found {len(company_decision_makers)} decision makers for {company_name}")
+        print(f"  Searching for {title} at {company_name}")
+        search_results = await search_linkedin_profiles_google_api(
+            client, title, company_name, max_results_per_search, company_decision_maker_titles, already_found_names
+        )
+        client.stats["titles"] += 1
+        if search_results is None:
+            return None
+        if not search_results:
+            print(f"    No relevant LinkedIn profiles found for {title} at {company_name}")
+
+        for result_data in search_results:
+            result_data['industry'] = industry
+        hit_rates.record(industry_key(industry), title, search_results)
+        progress_data[progress_key] = search_results
+        save_progress(PROGRESS_FILE, progress_data)
+        return search_results
+
+    async def process_company(client, position, company_name, industry):
+        print(f"\nProcessing company {position}/{total_companies}: {company_name}")
+        print(f"Industry: {industry}")
+
+        # Get industry-specific decision maker titles instead of using the passed parameter
+        company_decision_maker_titles = get_industry_specific_titles(industry)
+        print(f"Using {len(company_decision_maker_titles)} industry-specific titles: {company_decision_maker_titles}")
+
+        # Titles already in progress cost nothing, so they go first; the rest by hit rate
+        ordered_titles = hit_rates.order(industry_key(industry), company_decision_maker_titles)
+        ordered_titles.sort(key=lambda title: f"{company_name}_{title}" not in progress_data)
+
+        # Titles are searched one after another so the company can stop at the target;
+        # other companies keep the search client busy meanwhile
+        company_decision_makers = {}
+        for searched, title in enumerate(ordered_titles):
+            if TARGET_CONTACTS_PER_COMPANY and len(company_decision_makers) >= TARGET_CONTACTS_PER_COMPANY:
+                planner_stats["titles_skipped"] += len(ordered_titles) - searched
+                print(f"  Reached {TARGET_CONTACTS_PER_COMPANY} decision makers, "
+                      f"skipping {len(ordered_titles) - searched} remaining titles")
+                break
 
+            profiles = await search_title(client, company_name, industry, title, company_decision_maker_titles,
+                                          list(company_decision_makers))
+            if profiles is None:
+                print(f"  Quota ran out before all titles of {company_name} were searched; it will be resumed next run")
+                return
+
+            for person_data in profiles:
+                name = person_data.get('name')
+                if name and name not in company_decision_makers:
+                    company_decision_makers[name] = {
+                        'job_title': person_data.get('job_title'),
+                        'linkedin_url': person_data.get('linkedin_url')
+                    }
+                    print(f"      Found: {name} - {person_data.get('job_title')}")
+
+        final_results[company_name] = company_decision_makers
+        save_progress(OUTPUT_FILE, final_results)
+        print(f"  Found {len(company_decision_makers)} decision makers for {company_name}")
+
+    company_semaphore = asyncio.Semaphore(SEARCH_COMPANY_CONCURRENCY)
+
+    async def process_company_bounded(client, position, company_name, industry):
+        async with company_semaphore:
             if not api_manager.can_make_request():
-                print("All API keys have hit their daily limits. Stopping processing.")
-                break
+                return
+            # One company's error must not cancel the others sharing the search client
+            try:
+                await process_company(client, position, company_name, industry)
+            except Exception as e:
+                print(f"  Error processing {company_name}, it will be resumed next run: {str(e)}")
 
-    except KeyboardInterrupt:
+    try:
+        pending_companies = []
+        for position, (_, row) in enumerate(filtered_companies.iterrows(), 1):
+            if row['company'] in final_results:
+                print(f"Company {row['company']} already processed, skipping...")
+                continue
+            pending_companies.append((position, row['company'], row['industry']))
+
+        # How far today's remaining quota goes, worst case two queries per title
+        titles_left = [sum(f"{company_name}_{title}" not in progress_data
+                           for title in get_industry_specific_titles(industry))
+                       for _, company_name, industry in pending_companies]
+        print_quota_plan(api_manager.remaining_quota(), titles_left)
+
+        search_cache = get_search_result_cache()
+        async with AsyncGoogleSearchClient(api_manager, cache=search_cache, offline=SEARCH_CACHE_OFFLINE) as client:
+            await asyncio.gather(*[process_company_bounded(client, position, company_name, industry)
+                                   for position, company_name, industry in pending_companies])
+            print(f"Search requests: {client.stats}, planner: {planner_stats}")
+            print(f"Search cache: {search_cache.stats()}")
+
+            # Re-plan what is still pending with the queries per title actually observed
+            if client.stats["titles"]:
+                still_pending = [(company_name, industry) for _, company_name, industry in pending_companies
+                                 if company_name not in final_results]
+                titles_left = [sum(f"{company_name}_{title}" not in progress_data
+                                   for title in get_industry_specific_titles(industry))
+                               for company_name, industry in still_pending]
+                print_quota_plan(api_manager.remaining_quota(), titles_left,
+                                 round(client.stats["requests"] / client.stats["titles"], 2))
+
+        if not api_manager.can_make_request():
+            print("All API keys have hit their daily limits. Queuing for next day...")
+            print("Please run this script tomorrow to continue processing.")
+
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\nScraping interrupted by user. Progress saved.")
     except Exception as e:
         print(f"Error during scraping: {str(e)}")
+    finally:
+        api_manager.close()
 
     print(f"\nScraping completed. Results saved to {OUTPUT_FILE}")
     return final_results
 
 
 class GoogleAPIManager:
-    def __init__(self, csv_file, daily_limit, warning_threshold):
+    """
+    In-memory scheduler for the Google API keys in api_csv_path.
+
+    Keys with quota left are served round robin from a deque, so picking a key and counting
+    a use are O(1) and touch no files. reserve_key() rotates the deque and holds one use of
+    the key until the request ends (increment_usage() or release_key()), so concurrent
+    requests spread over the keys and in-flight requests cannot push a key past
+    daily_limit. Uses are appended to "<csv>.wal" in batches
+    (every flush_every uses or flush_interval seconds) and folded back into the CSV on
+    load and close(). All methods are synchronous and lock-protected, so one manager can
+    be shared by concurrent asyncio tasks and threads.
+    """
+
+    def __init__(self, csv_file, daily_limit, warning_threshold, flush_every=20, flush_interval=30.0):
         self.csv_file = csv_file
+        self.wal_file = f"{csv_file}.wal"
         self.daily_limit = daily_limit
         self.warning_threshold = warning_threshold
-        self.current_key_index = 0
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = Counter()  # key index -> uses not yet in the WAL
+        self._reserved = Counter()  # key index -> requests in flight
+        self._cooldown_until = {}  # key index -> time.time() before which the key is not handed out
+        self._last_flush = time.time()
         self.load_keys()
 
     def load_keys(self):
         try:
             self.df = pd.read_csv(self.csv_file)
+            self.api_keys = self.df['api_key'].astype(str).tolist()
+            self.cse_ids = self.df['cse_id'].astype(str).tolist()
+            self.uses = [int(u) for u in self.df.get('uses', pd.Series([0] * len(self.df))).fillna(0)]
+            self.last_used_dates = [str(d) for d in
+                                    self.df.get('last_used_date', pd.Series([""] * len(self.df))).fillna("")]
+            self._replay_wal()
             self.update_daily_usage()
-            print(f"Loaded {len(self.df)} API keys")
+            print(f"Loaded {len(self.api_keys)} API keys")
         except Exception as e:
             raise Exception(f"Error loading API keys: {str(e)}")
 
-    def update_daily_usage(self):
-        # today = datetime.now().strftime('%Y-%m-%d')       # for IST
-        today = (datetime.now() + timedelta(hours=-12.5)).strftime('%Y-%m-%d %H:%M') + " PST"       # for Pacific Standard Time - google search results reset at midnight of this
+    def _replay_wal(self):
+        """Apply uses logged by a run that did not close cleanly."""
+        if not os.path.exists(self.wal_file):
+            return
+        with open(self.wal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    idx, count, date = entry['index'], entry['uses'], entry['date']
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # torn last line
+                if not 0 <= idx < len(self.uses):
+                    continue
+                if self.last_used_dates[idx] != date:
+                    self.last_used_dates[idx], self.uses[idx] = date, 0
+                self.uses[idx] += count
 
-        for idx, row in self.df.iterrows():
-            if row['last_used_date'] != today:
-                self.df.at[idx, 'uses'] = 0
-                self.df.at[idx, 'last_used_date'] = today
+    def update_daily_usage(self):
+        # Google resets the daily quota at midnight Pacific time, so usage is kept per Pacific date
+        today = quota_day()
+        self.today = today
+        self._reset_at = next_quota_reset().timestamp()
+
+        with self._lock:
+            for idx in range(len(self.api_keys)):
+                if self.last_used_dates[idx] != today:
+                    self.uses[idx] = 0
+                    self.last_used_dates[idx] = today
+            self._available = deque(idx for idx in range(len(self.api_keys)) if self._has_quota(idx))
 
         self.save_keys()
 
-    def get_next_available_key(self):
-        for _ in range(len(self.df)):
-            current_row = self.df.iloc[self.current_key_index]
+    def _has_quota(self, idx):
+        return self.uses[idx] + self._reserved[idx] < self.daily_limit
+
+    def _check_reset(self):
+        if time.time() >= self._reset_at:
+            print("🌅 Pacific midnight passed - daily API quota reset")
+            self.update_daily_usage()
 
-            if current_row['uses'] < self.daily_limit:
-                return {
-                    'api_key': current_row['api_key'],
-                    'cse_id': current_row['cse_id'],
-                    'index': self.current_key_index
-                }
+    def _key_data(self, idx, wait=0.0):
+        return {
+            'api_key': self.api_keys[idx],
+            'cse_id': self.cse_ids[idx],
+            'index': idx,
+            'wait': wait
+        }
 
-            self.current_key_index = (self.current_key_index + 1) % len(self.df)
+    def get_next_available_key(self):
+        """The key the next request would get, without reserving it (None if no quota is left)."""
+        self._check_reset()
+        with self._lock:
+            # Exhausted keys are dropped lazily; keys whose quota is only reserved stay in the deque
+            while self._available and self.uses[self._available[0]] >= self.daily_limit:
+                self._available.popleft()
+            for idx in self._available:
+                if self._has_quota(idx):
+                    return self._key_data(idx)
+            return None
 
-        return None
+    def reserve_key(self):
+        """
+        Hand out the next key with quota left, round robin, and hold one use of it until
+        increment_usage() or release_key(). Keys backed off after a 429 are skipped while
+        another key is usable; if all are, the soonest one comes back with 'wait' (seconds) set.
+        """
+        self._check_reset()
+        with self._lock:
+            while self._available and self.uses[self._available[0]] >= self.daily_limit:
+                self._available.popleft()
+            now = time.time()
+            soonest = None
+            for _ in range(len(self._available)):
+                idx = self._available[0]
+                self._available.rotate(-1)
+                if not self._has_quota(idx):
+                    continue
+                wait = self._cooldown_until.get(idx, 0.0) - now
+                if wait <= 0:
+                    self._reserved[idx] += 1
+                    return self._key_data(idx)
+                if soonest is None or wait < soonest[1]:
+                    soonest = (idx, wait)
+            if soonest is None:
+                return None
+            self._reserved[soonest[0]] += 1
+            return self._key_data(*soonest)
+
+    def release_key(self, key_index):
+        """Give back a reservation whose request never reached the API."""
+        with self._lock:
+            if self._reserved[key_index] > 0:
+                self._reserved[key_index] -= 1
+
+    def back_off_key(self, key_index, seconds):
+        """Do not hand out key_index for the next seconds, e.g. after a per-minute 429."""
+        with self._lock:
+            self._cooldown_until[key_index] = time.time() + seconds
+
+    def mark_exhausted(self, key_index):
+        """Google says the key's daily quota is used up; stop handing it out until the reset."""
+        with self._lock:
+            if self.uses[key_index] < self.daily_limit:
+                self._pending[key_index] += self.daily_limit - self.uses[key_index]
+                self.uses[key_index] = self.daily_limit
+        print(f"🚫 API key {key_index + 1} is out of daily quota according to Google")
 
     def increment_usage(self, key_index):
-        self.df.at[key_index, 'uses'] += 1
-        current_uses = self.df.at[key_index, 'uses']
+        """Count a request that reached the API, turning its reservation into a use."""
+        with self._lock:
+            if self._reserved[key_index] > 0:
+                self._reserved[key_index] -= 1
+            self.uses[key_index] += 1
+            current_uses = self.uses[key_index]
+            self._pending[key_index] += 1
+
+            flush_due = (sum(self._pending.values()) >= self.flush_every
+                         or time.time() - self._last_flush >= self.flush_interval)
 
         if current_uses == self.warning_threshold:
             print("=" * 50 + "\n\n")
@@ -398,96 +561,107 @@ class GoogleAPIManager:
             print(f"🚫 API key {key_index + 1} has hit daily limit ({self.daily_limit} uses)")
             print("\n" + "=" * 50)
 
-        self.save_keys()
-        self.current_key_index = (key_index + 1) % len(self.df)
+        if flush_due:
+            self.flush()
 
     def can_make_request(self):
         return self.get_next_available_key() is not None
 
-    def save_keys(self):
-        try:
-            self.df.to_csv(self.csv_file, index=False)
-        except Exception as e:
-            print(f"Error saving API keys: {str(e)}")
+    def remaining_quota(self):
+        """Queries left today across all keys."""
+        with self._lock:
+            return sum(max(0, self.daily_limit - uses - self._reserved[idx]) for idx, uses in enumerate(self.uses))
+
+    def flush(self):
+        """Append the batched uses to the WAL (one write + fsync)."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._last_flush = time.time()
+            if not pending:
+                return
+            lines = "".join(json.dumps({'index': idx, 'uses': count, 'date': self.last_used_dates[idx]}) + "\n"
+                            for idx, count in pending.items())
+            try:
+                with open(self.wal_file, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print(f"Error writing API key usage log: {str(e)}")
+                self._pending.update(pending)
 
+    def save_keys(self):
+        """Write current usage to the CSV (atomic replace) and clear the WAL."""
+        with self._lock:
+            self._pending.clear()  # included in the CSV written below
+            self.df['uses'] = self.uses
+            self.df['last_used_date'] = self.last_used_dates
+            try:
+                tmp_file = f"{self.csv_file}.tmp"
+                self.df.to_csv(tmp_file, index=False)
+                os.replace(tmp_file, self.csv_file)
+                if os.path.exists(self.wal_file):
+                    os.remove(self.wal_file)
+            except Exception as e:
+                print(f"Error saving API keys: {str(e)}")
+
+    def close(self):
+        self.save_keys()
 
-def search_linkedin_profiles_google_api(api_manager, title, company_name, max_results, decision_maker_titles,
-                                        already_found_names):
-    key_data = api_manager.get_next_available_key()
-    if not key_data:
-        print("No available API keys")
-        return []
 
+async def search_linkedin_profiles_google_api(client, title, company_name, max_results, decision_maker_titles,
+                                              already_found_names):
+    """
+    Search LinkedIn profiles for one title at one company. The "+"-joined fallback query is only
+    sent when the quoted query found nobody relevant. Returns None if no query could be run.
+    """
     search_queries = [
         f'site:linkedin.com/in/ "{title}" AND "{company_name}"',
         f'site:linkedin.com/in/ {title.replace(" ", "+")} AND {company_name.replace(" ", "+")}'
     ]
 
     all_results = []
+    queries_run = 0
 
     for query in search_queries:
-        if len(all_results) >= max_results:
+        if all_results:
             break
 
         print(f"    API query: {query}")
+        items = await client.search(query, num=10)  # Get first 10 google search results
+        if items is None:
+            continue
+        queries_run += 1
 
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            'key': key_data['api_key'],
-            'cx': key_data['cse_id'],
-            'q': query,
-            'num': 10  # Get first 10 google search results
-        }
-
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            api_manager.increment_usage(key_data['index'])
-
-            if response.status_code == 200:
-                data = response.json()
-
-                if 'items' in data:
-                    for item in data['items']:
-                        # Check relevance before processing
-                        is_relevant, reason = is_profile_relevant(item, decision_maker_titles, company_name, already_found_names)
-                        if is_relevant:
-                            person_name = extract_person_name_from_title(item.get('title', ''))
-                            job_title = extract_current_job_title(item.get('title', ''), item.get('snippet', ''),
-                                                                  decision_maker_titles)
-                            linkedin_url = item.get('link', '')
-
-                            if person_name and job_title and 'linkedin.com/in/' in linkedin_url:
-                                result_data = {
-                                    'name': person_name,
-                                    'job_title': job_title,
-                                    'linkedin_url': linkedin_url
-                                }
-                                all_results.append(result_data)
-                                print(f"      Relevant profile found: {person_name} - {job_title}")
-
-                                if len(all_results) >= max_results:
-                                    break
-                        else:
-                            print(f"      Skipped irrelevant ({reason}): {item.get('title', 'N/A')}")
-
-                else:
-                    print(f"    No results found for query: {query}")
-            else:
-                print(f"    API request failed: {response.status_code} - {response.text}")
-                if response.status_code == 429:
-                    print("    Rate limit hit, trying next key...")
-                    key_data = api_manager.get_next_available_key()
-                    if not key_data:
-                        break
-
-        except Exception as e:
-            print(f"    Error making API request: {str(e)}")
+        if not items:
+            print(f"    No results found for query: {query}")
             continue
 
-        key_data = api_manager.get_next_available_key()
-        if not key_data:
-            break
+        for item in items:
+            # Check relevance before processing
+            is_relevant, reason = is_profile_relevant(item, decision_maker_titles, company_name, already_found_names)
+            if is_relevant:
+                person_name = extract_person_name_from_title(item.get('title', ''))
+                job_title = extract_current_job_title(item.get('title', ''), item.get('snippet', ''),
+                                                      decision_maker_titles)
+                linkedin_url = item.get('link', '')
+
+                if person_name and job_title and 'linkedin.com/in/' in linkedin_url:
+                    all_results.append({
+                        'name': person_name,
+                        'job_title': job_title,
+                        'linkedin_url': linkedin_url
+                    })
+                    already_found_names.append(person_name)
+                    print(f"      Relevant profile found: {person_name} - {job_title}")
+
+                    if len(all_results) >= max_results:
+                        break
+            else:
+                print(f"      Skipped irrelevant ({reason}): {item.get('title', 'N/A')}")
 
+    if not queries_run:
+        return None
     return all_results[:max_results]
 
 
@@ -512,8 +686,6 @@ def save_progress(filename, data):
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
-
     # Example parameters
     JOB_TITLE = "Software_Engineer"  # Used for output file naming
     LINKEDIN_COMPANY_SIZE_FILTER = '["1-10", "11-50", "51-200"]'  # JSON string
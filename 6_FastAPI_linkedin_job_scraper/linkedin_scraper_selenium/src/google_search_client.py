@@ -0,0 +1,126 @@
+import asyncio
+import os
+
+import aiohttp
+
+from src.rate_limiter import AsyncTokenBucket
+
+# Override to run stage 3 against a local fake search server
+GOOGLE_SEARCH_API_URL = os.getenv("GOOGLE_SEARCH_API_URL", "https://www.googleapis.com/customsearch/v1")
+SEARCH_MAX_CONCURRENCY = int(os.getenv("SEARCH_MAX_CONCURRENCY", "8"))  # requests in flight, all keys together
+SEARCH_QPS_PER_KEY = float(os.getenv("SEARCH_QPS_PER_KEY", "1"))
+SEARCH_QPS_BURST = int(os.getenv("SEARCH_QPS_BURST", "1"))  # requests a key may send back to back
+SEARCH_KEY_BACKOFF_SECONDS = float(os.getenv("SEARCH_KEY_BACKOFF_SECONDS", "60"))  # key rest after a 429
+
+
+class AsyncGoogleSearchClient:
+    """
+    Google Custom Search client for asyncio code.
+
+    One aiohttp session (connection pool) is shared by all searches; a global semaphore caps
+    requests in flight and each key has its own token bucket (qps_per_key, burst). Keys,
+    daily budgets and usage accounting come from the GoogleAPIManager. With a cache, queries
+    answered within its TTL are served from it and cost no API call.
+
+    Usage:
+        async with AsyncGoogleSearchClient(api_manager) as client:
+            items = await client.search('site:linkedin.com/in/ "CTO" AND "Acme"')
+
+    Args:
+        api_manager (GoogleAPIManager): Hands out keys and counts their usage
+        base_url (str): Search endpoint
+        max_concurrency (int): Requests in flight across all keys
+        qps_per_key (float): Requests per second per key
+        burst (int): Requests a key may send back to back before qps_per_key applies
+        cache (SearchResultCache): Optional store of raw result items per query
+        offline (bool): Only answer from the cache, never call the API
+        timeout (float): Seconds per request
+    """
+
+    def __init__(self, api_manager, base_url=GOOGLE_SEARCH_API_URL, max_concurrency=SEARCH_MAX_CONCURRENCY,
+                 qps_per_key=SEARCH_QPS_PER_KEY, burst=SEARCH_QPS_BURST, cache=None, offline=False,
+                 timeout=30):
+        self.api_manager = api_manager
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.qps_per_key = qps_per_key
+        self.burst = burst
+        self.key_buckets = {}  # key index -> AsyncTokenBucket
+        self.cache = cache
+        self.offline = offline
+        self.stats = {"requests": 0, "cached": 0, "failed": 0, "rate_limited": 0, "titles": 0}
+        self._semaphore = None
+        self._session = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._session.close()
+
+    async def search(self, query, num=10, max_attempts=2):
+        """
+        Run one query. Returns the result items ([] when Google found nothing), or None when
+        no key has quota left or every attempt failed.
+        """
+        if self.cache:
+            items = self.cache.get(query, self.api_manager.cse_ids, num)
+            if items is not None:
+                self.stats["cached"] += 1
+                return items
+            if self.offline:
+                print("    Not in the search cache (offline)")
+                return None
+
+        for _ in range(max_attempts):
+            key_data = self.api_manager.reserve_key()
+            if not key_data:
+                print("    No available API keys")
+                return None
+            if key_data['wait']:
+                await asyncio.sleep(key_data['wait'])
+
+            params = {'key': key_data['api_key'], 'cx': key_data['cse_id'], 'q': query, 'num': num}
+            bucket = self.key_buckets.get(key_data['index'])
+            if bucket is None:
+                bucket = self.key_buckets[key_data['index']] = AsyncTokenBucket(self.qps_per_key, self.burst)
+            await bucket.acquire()
+            counted = False
+            async with self._semaphore:
+                try:
+                    async with self._session.get(self.base_url, params=params) as response:
+                        self.api_manager.increment_usage(key_data['index'])
+                        counted = True
+                        self.stats["requests"] += 1
+                        if response.status == 200:
+                            data = await response.json(content_type=None)
+                            items = data.get('items', [])
+                            if self.cache:
+                                self.cache.put(query, key_data['cse_id'], items, num)
+                            return items
+                        body = await response.text()
+                # ValueError: a 200 whose body is not JSON counts as a failed attempt
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    if not counted:
+                        self.api_manager.release_key(key_data['index'])
+                    self.stats["failed"] += 1
+                    print(f"    Error making API request: {str(e)}")
+                    continue
+
+            self.stats["failed"] += 1
+            print(f"    API request failed: {response.status} - {body[:200]}")
+            if response.status == 429:
+                self.stats["rate_limited"] += 1
+                if "per day" in body.lower() or "dailylimitexceeded" in body.lower():
+                    self.api_manager.mark_exhausted(key_data['index'])
+                else:
+                    self.api_manager.back_off_key(key_data['index'], SEARCH_KEY_BACKOFF_SECONDS)
+                print("    Rate limit hit, trying next key...")
+                continue
+            return None
+        return None
@@ -0,0 +1,92 @@
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+
+# How text is entered into form fields:
+#   "paste"       - one send_keys call with the whole text (one WebDriver round trip)
+#   "insert_text" - CDP Input.insertText into the focused field, like a paste from the clipboard
+#   "chunked"     - a few characters per send_keys with short pauses
+#   "human"       - one character at a time with 50-200 ms pauses (slowest, most human-like)
+STRATEGIES = ("paste", "insert_text", "chunked", "human")
+
+# Strategy per call site; the login form is where typing patterns matter most
+INPUT_STRATEGY_LOGIN = os.getenv("INPUT_STRATEGY_LOGIN", "chunked")
+INPUT_STRATEGY_COMPANY_SEARCH = os.getenv("INPUT_STRATEGY_COMPANY_SEARCH", "insert_text")
+INPUT_STRATEGY_JOB_SEARCH = os.getenv("INPUT_STRATEGY_JOB_SEARCH", "paste")
+
+_stats_lock = threading.Lock()
+input_stats = defaultdict(lambda: {"calls": 0, "chars": 0, "seconds": 0.0})
+
+
+def _paste(element, text):
+    element.send_keys(text)
+
+
+def _insert_text(element, text):
+    driver = element.parent
+    driver.execute_script("arguments[0].focus();", element)
+    try:
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+    except Exception:
+        # Not a Chromium driver - fall back to a single send_keys
+        element.send_keys(text)
+
+
+def _chunked(element, text, min_chunk=3, max_chunk=6):
+    position = 0
+    while position < len(text):
+        size = random.randint(min_chunk, max_chunk)
+        element.send_keys(text[position:position + size])
+        position += size
+        time.sleep(random.uniform(0.05, 0.15))
+
+
+def _human(element, text):
+    for char in text:
+        element.send_keys(char)
+        time.sleep(random.uniform(0.05, 0.2))
+    time.sleep(0.5)
+
+
+_TYPERS = {"paste": _paste, "insert_text": _insert_text, "chunked": _chunked, "human": _human}
+
+
+def type_text(element, text, strategy="human", settle=0.0):
+    """
+    Enter text into a field with the given strategy and record how long it took.
+
+    Args:
+        element: Input WebElement
+        text (str): Text to enter
+        strategy (str): One of STRATEGIES
+        settle (float): Extra pause after typing, e.g. before pressing Enter
+    """
+    if strategy not in _TYPERS:
+        raise ValueError(f"Unknown input strategy: {strategy}")
+    text = text or ""
+    start = time.time()
+    _TYPERS[strategy](element, text)
+    if settle:
+        time.sleep(settle)
+    elapsed = time.time() - start
+    with _stats_lock:
+        stats = input_stats[strategy]
+        stats["calls"] += 1
+        stats["chars"] += len(text)
+        stats["seconds"] += elapsed
+    return elapsed
+
+
+def report_input_stats():
+    """Print time spent typing per strategy."""
+    with _stats_lock:
+        rows = [(strategy, dict(stats)) for strategy, stats in input_stats.items()]
+    if not rows:
+        return
+    print("⌨️ Input timing")
+    for strategy, stats in rows:
+        per_call = stats["seconds"] / stats["calls"] if stats["calls"] else 0
+        print(f"   {strategy:<12} {stats['calls']:>4} fields, {stats['chars']:>5} chars, "
+              f"{stats['seconds']:.1f}s total, {per_call:.2f}s per field")
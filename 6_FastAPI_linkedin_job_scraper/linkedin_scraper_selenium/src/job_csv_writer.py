@@ -0,0 +1,194 @@
+import csv
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+JOB_FIELDNAMES = ['title', 'company', 'location', 'url', 'job_description', 'scraped_at', 'posted_on']
+
+
+def job_url_key(job_url):
+    """
+    Dedup key for a job URL: the LinkedIn job id, else the URL without its query string.
+    Card hrefs carry per-session trackingId/refId parameters, so raw URLs differ between runs.
+    """
+    match = re.search(r'(?:/jobs/view/|currentJobId=)(\d+)', job_url or "")
+    if match:
+        return match.group(1)
+    return (job_url or "").split("?")[0].split("#")[0] or None
+
+
+class JobCsvWriter:
+    """
+    Long-lived CSV writer for scraped jobs.
+
+    The file stays open for the whole run; rows are flushed and fsynced every
+    flush_every_rows rows or flush_every_seconds seconds, whichever comes first. The header
+    is written once. Reopening an existing file resumes appending: a half-written last line
+    left by a crash is cut off, and rows whose key_field is already in the file are skipped.
+
+    A "<file>.inprogress" marker exists while a run is writing, so the next run can tell a
+    crashed run (resume) from a finished one (rotate the old file away and start fresh).
+    Writes are lock-protected, so browser workers can share one writer; write_rows() keeps
+    a page's rows together.
+
+    Args:
+        path (str): CSV file to write
+        fieldnames (list): Column order
+        key_field (str): Column used to detect duplicate rows
+        key_func (callable): Maps a key_field value to the dedup key (default: job_url_key
+            for "url", the value itself otherwise)
+        flush_every_rows (int): Flush after this many buffered rows
+        flush_every_seconds (float): Flush when the oldest buffered row is this old
+    """
+
+    def __init__(self, path, fieldnames=JOB_FIELDNAMES, key_field="url", flush_every_rows=10,
+                 flush_every_seconds=5.0, key_func=None):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.key_field = key_field
+        self.key_func = key_func or (job_url_key if key_field == "url" else (lambda value: value))
+        self.flush_every_rows = flush_every_rows
+        self.flush_every_seconds = flush_every_seconds
+        self.marker_path = f"{path}.inprogress"
+        self.rows_written = 0
+        self.duplicates_skipped = 0
+        self._buffered = 0
+        self._last_flush = time.time()
+        self._seen_keys = set()
+        self._file = None
+        self._writer = None
+        self._lock = threading.RLock()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    @property
+    def interrupted_run(self):
+        """True if the last run writing this file did not close it cleanly."""
+        return os.path.exists(self.marker_path)
+
+    def open(self, resume=None):
+        """
+        Open the file for appending.
+
+        Args:
+            resume (bool): True to keep appending to an existing file, False to rotate it away
+                first. None resumes only if the previous run was interrupted.
+        """
+        if resume is None:
+            resume = self.interrupted_run
+        if not resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            self.rotate_existing()
+
+        has_rows = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if has_rows:
+            self._repair_tail()
+            self._load_existing_keys()
+
+        with open(self.marker_path, 'w') as marker:
+            marker.write(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+        self._file = open(self.path, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        if not has_rows or self._file.tell() == 0:
+            self._writer.writeheader()
+            self.flush()
+        elif resume:
+            print(f"♻️ Resuming {self.path} ({len(self._seen_keys)} rows already saved)")
+        return self
+
+    def _repair_tail(self):
+        """Cut off a partially written last line left behind by a crash."""
+        with open(self.path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 65536))
+            tail = f.read()
+            if tail.endswith(b"\n"):
+                return
+            last_newline = tail.rfind(b"\n")
+            keep = size - len(tail) + last_newline + 1 if last_newline >= 0 else 0
+            f.truncate(keep)
+            print(f"⚠️ Dropped a partially written row at the end of {self.path}")
+
+    def _load_existing_keys(self):
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                key = self.key_func(row.get(self.key_field))
+                if key:
+                    self._seen_keys.add(key)
+
+    def write_row(self, row):
+        """Buffer one row. Returns False if a row with the same key was already written."""
+        value = row.get(self.key_field)
+        key = self.key_func(value) if value and value != "URL not found" else None
+        with self._lock:
+            if key:
+                if key in self._seen_keys:
+                    self.duplicates_skipped += 1
+                    return False
+                self._seen_keys.add(key)
+
+            self._writer.writerow(row)
+            self.rows_written += 1
+            self._buffered += 1
+            if (self._buffered >= self.flush_every_rows
+                    or time.time() - self._last_flush >= self.flush_every_seconds):
+                self.flush()
+            return True
+
+    def write_rows(self, rows):
+        with self._lock:
+            return sum(1 for row in rows if self.write_row(row))
+
+    def flush(self):
+        """Push buffered rows to disk (flush + fsync)."""
+        with self._lock:
+            if not self._file:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._buffered = 0
+            self._last_flush = time.time()
+
+    def rotate_existing(self):
+        """Atomically move the current file to a timestamped name so a new run starts empty."""
+        stem, ext = os.path.splitext(self.path)
+        rotated_path = f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+        os.replace(self.path, rotated_path)
+        print(f"🗂️ Previous results moved to {rotated_path}")
+        return rotated_path
+
+    def rotate(self):
+        """Close the current file, move it aside and continue writing to a fresh one."""
+        with self._lock:
+            self.flush()
+            self._file.close()
+            rotated_path = self.rotate_existing()
+            self._seen_keys.clear()
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+            self._writer.writeheader()
+            self.flush()
+            return rotated_path
+
+    def close(self, completed=True):
+        """Flush and close. completed=False keeps the marker so the next run resumes."""
+        with self._lock:
+            if self._file:
+                self.flush()
+                self._file.close()
+                self._file = None
+        if completed and os.path.exists(self.marker_path):
+            os.remove(self.marker_path)
+
+    def __enter__(self):
+        if not self._file:
+            self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(completed=exc_type is None)
@@ -0,0 +1,67 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_METADATA_PATH = "./scraped_data/metadata.db"
+
+
+def make_scope_key(job_title, location, filters):
+    """Stable key for a search: job title, location and the filter set (order-insensitive lists)."""
+    normalized_filters = {name: sorted(value) if isinstance(value, (list, tuple)) else value
+                          for name, value in sorted((filters or {}).items())}
+    return json.dumps([job_title, location, normalized_filters], sort_keys=True)
+
+
+class MetadataStore:
+    """
+    Small SQLite store for scraping metadata.
+
+    Holds one watermark per (job title, location, filter set): the UTC time up to which that
+    search has been fully scraped. Jobs posted before the watermark are skipped by later runs.
+    """
+
+    def __init__(self, db_path=DEFAULT_METADATA_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_watermarks (
+                scope_key TEXT PRIMARY KEY,
+                job_title TEXT NOT NULL,
+                location TEXT NOT NULL,
+                filters TEXT NOT NULL,
+                watermark TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get_watermark(self, job_title, location, filters=None, default=None):
+        """Return the 'YYYY-MM-DD HH:MM' UTC watermark for a search, or default if it never completed."""
+        with self._lock:
+            row = self.conn.execute("SELECT watermark FROM scrape_watermarks WHERE scope_key = ?",
+                                    (make_scope_key(job_title, location, filters),)).fetchone()
+        return row[0] if row else default
+
+    def set_watermark(self, job_title, location, filters, watermark):
+        """Atomically record a new watermark; it never moves backwards."""
+        scope_key = make_scope_key(job_title, location, filters)
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M')
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO scrape_watermarks (scope_key, job_title, location, filters, watermark, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(scope_key) DO UPDATE SET
+                    watermark = MAX(scrape_watermarks.watermark, excluded.watermark),
+                    updated_at = excluded.updated_at
+            """, (scope_key, job_title, location, json.dumps(filters or {}, sort_keys=True), watermark, now))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
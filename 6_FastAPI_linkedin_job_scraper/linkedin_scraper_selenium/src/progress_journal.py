@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+
+
+class ProgressJournal:
+    """
+    Append-only JSONL journal of finished items ({"key": ..., "data": ...} per line).
+
+    Each save appends and fsyncs one line, so it costs the same at item 10 and item 10,000.
+    On open the journal is replayed (later lines win, a torn last line from a crash is
+    ignored). Every compact_every appends it is rewritten to one line per key in a temp
+    file that atomically replaces the journal.
+
+    Args:
+        path (str): Journal file (.jsonl)
+        compact_every (int): Appends between compactions
+    """
+
+    def __init__(self, path, compact_every=200):
+        self.path = path
+        self.compact_every = compact_every
+        self.entries = {}
+        self._appends = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def replay(self):
+        """Load the journal into entries and open it for appending. Returns entries."""
+        self.entries = {}
+        skipped = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self.entries[record["key"]] = record.get("data")
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        skipped += 1
+        if skipped:
+            print(f"⚠️ Ignored {skipped} unreadable line(s) in {self.path}")
+            self.compact()
+        self._open()
+        return self.entries
+
+    def _open(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+    def append(self, key, data):
+        """Durably record one finished item."""
+        line = json.dumps({"key": key, "data": data}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._open()
+            self.entries[key] = data
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._appends += 1
+            if self._appends >= self.compact_every:
+                self._compact_locked()
+
+    def compact(self):
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, data in self.entries.items():
+                f.write(json.dumps({"key": key, "data": data}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file:
+            self._file.close()
+            self._file = None
+        os.replace(tmp_path, self.path)
+        self._appends = 0
+        self._open()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """Delete the journal, e.g. once the run's results are saved elsewhere."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,62 @@
+import os
+from collections import defaultdict
+
+# Stop searching a company's titles once this many decision makers were found (0: search every title)
+TARGET_CONTACTS_PER_COMPANY = int(os.getenv("TARGET_CONTACTS_PER_COMPANY", "3"))
+
+
+class TitleHitRates:
+    """
+    How often each decision maker title found someone, per industry, used to search the
+    most productive titles first.
+
+    Rates are smoothed towards the title's rate over all industries (and that towards 0.5),
+    so titles with little history keep their place from DECISION_MAKER_TITLES until the
+    data says otherwise.
+
+    Args:
+        prior_weight (float): Searches worth of prior given to the fallback rate
+    """
+
+    def __init__(self, prior_weight=2.0):
+        self.prior_weight = prior_weight
+        self.by_industry = defaultdict(lambda: [0, 0])  # (industry, title) -> [hits, searches]
+        self.by_title = defaultdict(lambda: [0, 0])  # title -> [hits, searches]
+
+    def record(self, industry, title, found):
+        for counts in (self.by_industry[(industry, title)], self.by_title[title]):
+            counts[0] += bool(found)
+            counts[1] += 1
+
+    def rate(self, industry, title):
+        title_hits, title_searches = self.by_title.get(title, (0, 0))
+        title_rate = (title_hits + 0.5 * self.prior_weight) / (title_searches + self.prior_weight)
+        hits, searches = self.by_industry.get((industry, title), (0, 0))
+        return (hits + title_rate * self.prior_weight) / (searches + self.prior_weight)
+
+    def order(self, industry, titles):
+        """titles sorted by expected hit rate, best first (ties keep their given order)."""
+        return sorted(titles, key=lambda title: -self.rate(industry, title))
+
+    @classmethod
+    def learn(cls, progress_data, company_industries, known_titles, prior_weight=2.0):
+        """
+        Build the rates from scraping_progress.json history.
+
+        Args:
+            progress_data (dict): f"{company_name}_{title}" -> list of profiles found
+            company_industries (dict): Company name -> industry, for titles that found nobody
+            known_titles (iterable): All decision maker titles, to split the progress keys
+        """
+        rates = cls(prior_weight)
+        titles = sorted(set(known_titles), key=len, reverse=True)  # "VP of IT" must not match "IT"
+        for progress_key, profiles in progress_data.items():
+            title = next((t for t in titles if progress_key.endswith(f"_{t}")), None)
+            if title is None:
+                continue
+            company_name = progress_key[:-len(title) - 1]
+            industry = company_industries.get(company_name)
+            if not industry and profiles:
+                industry = profiles[0].get('industry')
+            rates.record(industry or "unknown", title, profiles)
+        return rates
@@ -0,0 +1,85 @@
+import asyncio
+import random
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by all workers of a stage, so adding workers overlaps
+    their latency without raising the total request rate.
+
+    Args:
+        rate_per_minute (float): Sustained number of acquisitions per minute
+        burst (int): Tokens that can be saved up while workers are busy
+        jitter (float): Extra random pause of up to this many seconds after each acquisition,
+            so requests are not evenly spaced
+    """
+
+    def __init__(self, rate_per_minute, burst=1, jitter=0.0):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.interval = 60.0 / rate_per_minute
+        self.burst = max(1, burst)
+        self.jitter = jitter
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+        self.acquired = 0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last) / self.interval)
+        self._last = now
+
+    def reserve(self):
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            self.acquired += 1
+            delay = max(0.0, -self._tokens * self.interval)
+            if self.jitter:
+                delay += random.uniform(0, self.jitter)
+            self.waited += delay
+            return delay
+
+    def acquire(self):
+        """Block until the caller may make its next request. Returns the seconds waited."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for asyncio tasks: up to burst requests at once, then rate_per_second.
+    Waiters are queued in arrival order.
+    """
+
+    def __init__(self, rate_per_second, burst=1):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.interval = 1.0 / rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) / self.interval)
+            self._last = now
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens * self.interval)
+            self.waited += delay
+            return delay
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# Google's daily Custom Search quota resets at midnight Pacific time (PST/PDT)
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# Worst case per title: the quoted query plus the "+"-joined fallback
+QUERIES_PER_TITLE = 2
+
+
+def quota_day(now=None):
+    """The quota day ('YYYY-MM-DD', Pacific time) that now (aware datetime, default: now) falls in."""
+    now = now or datetime.now(QUOTA_TIMEZONE)
+    return now.astimezone(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+def next_quota_reset(now=None):
+    """Aware datetime of the next Pacific midnight, DST-safe."""
+    now = (now or datetime.now(QUOTA_TIMEZONE)).astimezone(QUOTA_TIMEZONE)
+    tomorrow = now.date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=QUOTA_TIMEZONE)
+
+
+def plan_companies(remaining_queries, titles_per_company, queries_per_title=QUERIES_PER_TITLE):
+    """
+    Predict how many of the pending companies, in order, can be finished with the queries left today.
+
+    Args:
+        remaining_queries (int): Queries left across all keys
+        titles_per_company (list): Titles still to search for each pending company
+        queries_per_title (float): Expected queries per title
+
+    Returns:
+        dict: companies (finishable), pending, queries_needed (for all pending companies)
+    """
+    budget = remaining_queries
+    finishable = 0
+    for titles in titles_per_company:
+        cost = titles * queries_per_title
+        if cost > budget:
+            break
+        budget -= cost
+        finishable += 1
+    return {
+        "companies": finishable,
+        "pending": len(titles_per_company),
+        "queries_needed": sum(titles_per_company) * queries_per_title,
+    }
+
+
+def print_quota_plan(remaining_queries, titles_per_company, queries_per_title=QUERIES_PER_TITLE):
+    plan = plan_companies(remaining_queries, titles_per_company, queries_per_title)
+    reset_in = next_quota_reset() - datetime.now(QUOTA_TIMEZONE)
+    print(f"📊 Quota: {remaining_queries} queries left today, resets in {reset_in.total_seconds() / 3600:.1f}h "
+          f"(midnight Pacific)")
+    print(f"📊 Enough for {plan['companies']}/{plan['pending']} pending companies "
+          f"at {queries_per_title:g} queries per title ({plan['queries_needed']:g} queries needed for all)")
+    return plan
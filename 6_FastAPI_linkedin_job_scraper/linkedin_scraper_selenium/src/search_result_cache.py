@@ -0,0 +1,154 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH", "./scraped_data/cache/search_results.db")
+SEARCH_CACHE_TTL_DAYS = float(os.getenv("SEARCH_CACHE_TTL_DAYS", "14"))
+SEARCH_CACHE_MAX_BYTES = int(float(os.getenv("SEARCH_CACHE_MAX_MB", "100")) * 1024 * 1024)
+# "1": never call the API, only answer from the cache (re-run relevance filtering for free)
+SEARCH_CACHE_OFFLINE = os.getenv("SEARCH_CACHE_OFFLINE", "0") == "1"
+
+
+def normalize_query(query):
+    """Collapse whitespace and case; Google treats these variants of a query the same."""
+    return re.sub(r"\s+", " ", query or "").strip().lower()
+
+
+class SearchResultCache:
+    """
+    Raw Google Custom Search result items kept across runs and job titles (SQLite).
+
+    Entries are keyed by the normalized query, the CSE id and the number of results asked
+    for, so the same (title, company) query is paid for once per ttl_days no matter which
+    job title or progress file it came from. Least recently used entries are evicted once
+    the stored items exceed max_bytes.
+
+    Args:
+        db_path (str): SQLite file
+        ttl_days (float): How long an entry counts as fresh
+        max_bytes (int): Size limit of the stored items
+    """
+
+    def __init__(self, db_path=SEARCH_CACHE_PATH, ttl_days=SEARCH_CACHE_TTL_DAYS, max_bytes=SEARCH_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_results (
+                query_key TEXT NOT NULL,
+                cse_id TEXT NOT NULL,
+                num INTEGER NOT NULL,
+                query TEXT NOT NULL,
+                items TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (query_key, cse_id, num)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_search_results_last_access "
+                          "ON search_results(last_access)")
+        self.conn.execute("DELETE FROM search_results WHERE fetched_at < ?", (time.time() - self.ttl_seconds,))
+        self.conn.commit()
+        self.total_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM search_results").fetchone()[0]
+
+    def get(self, query, cse_ids, num=10):
+        """
+        Return the cached items for query under any of cse_ids, or None on a miss.
+
+        Args:
+            query (str): Search query as sent to Google
+            cse_ids (iterable): CSE ids whose results are acceptable (e.g. those of all keys)
+            num (int): Number of results asked for
+        """
+        cse_ids = sorted(set(cse_ids))
+        if not cse_ids:
+            return None
+        placeholders = ", ".join("?" * len(cse_ids))
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT cse_id, items FROM search_results WHERE query_key = ? AND num = ? "
+                f"AND fetched_at >= ? AND cse_id IN ({placeholders}) ORDER BY fetched_at DESC LIMIT 1",
+                (normalize_query(query), num, time.time() - self.ttl_seconds, *cse_ids)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute(
+                "UPDATE search_results SET last_access = ? WHERE query_key = ? AND cse_id = ? AND num = ?",
+                (time.time(), normalize_query(query), row[0], num))
+            self.conn.commit()
+        return json.loads(row[1])
+
+    def put(self, query, cse_id, items, num=10):
+        """Store the raw items of one query ([] is stored too: an empty answer also costs a query)."""
+        payload = json.dumps(items, ensure_ascii=False)
+        size_bytes = len(payload.encode("utf-8"))
+        query_key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            old = self.conn.execute(
+                "SELECT size_bytes FROM search_results WHERE query_key = ? AND cse_id = ? AND num = ?",
+                (query_key, cse_id, num)).fetchone()
+            if old:
+                self.total_bytes -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_results "
+                "(query_key, cse_id, num, query, items, size_bytes, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (query_key, cse_id, num, query, payload, size_bytes, now, now))
+            self.total_bytes += size_bytes
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            row = self.conn.execute(
+                "SELECT query_key, cse_id, num, size_bytes FROM search_results "
+                "ORDER BY last_access ASC LIMIT 1").fetchone()
+            if row is None:
+                break
+            self.conn.execute("DELETE FROM search_results WHERE query_key = ? AND cse_id = ? AND num = ?", row[:3])
+            self.total_bytes -= row[3]
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": self.total_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+search_result_cache = None
+
+
+def get_search_result_cache():
+    """Shared cache, opened on first use."""
+    global search_result_cache
+    if search_result_cache is None:
+        search_result_cache = SearchResultCache(SEARCH_CACHE_PATH, SEARCH_CACHE_TTL_DAYS, SEARCH_CACHE_MAX_BYTES)
+    return search_result_cache
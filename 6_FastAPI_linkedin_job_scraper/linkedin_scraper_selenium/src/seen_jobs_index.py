@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+DEFAULT_INDEX_PATH = "./scraped_data/cache/seen_jobs.db"
+
+
+class SeenJobsIndex:
+    """
+    Persistent index of LinkedIn job ids that were already scraped (SQLite).
+
+    Checked before a job card is clicked, so jobs seen on an earlier page, an earlier run
+    or another search are skipped without a click, extraction or summarization.
+    Safe to share between sharded scraping workers.
+
+    Args:
+        db_path (str): SQLite file
+        seen_within_days (float): A job counts as known if it was seen this recently;
+            0 disables skipping
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH, seen_within_days=30):
+        self.db_path = db_path
+        self.seen_within_days = seen_within_days
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                job_id TEXT PRIMARY KEY,
+                search_title TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def is_known(self, job_id):
+        """True if job_id was seen within the policy window. Counts skips."""
+        if not job_id or not self.seen_within_days:
+            return False
+        cutoff = (datetime.utcnow() - timedelta(days=self.seen_within_days)).strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM seen_jobs WHERE job_id = ? AND last_seen >= ?", (job_id, cutoff)).fetchone()
+            if row:
+                self.skipped += 1
+            return row is not None
+
+    def mark_seen(self, job_ids, search_title=""):
+        """Record job ids as scraped now."""
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(job_id, search_title, now, now) for job_id in job_ids if job_id]
+        if not rows:
+            return
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO seen_jobs (job_id, search_title, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET last_seen = excluded.last_seen", rows)
+            self.conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
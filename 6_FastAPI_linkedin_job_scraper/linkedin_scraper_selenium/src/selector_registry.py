@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+DEFAULT_STATS_PATH = "./scraped_data/cache/selector_stats.json"
+UNTRIED_SCORE = 0.5  # selectors with no history rank between winners and known misses
+
+
+class SelectorRegistry:
+    """
+    Records which selector of a fallback chain actually matched, and reorders the chain so
+    the historical winner is tried first and selectors that keep timing out are demoted.
+
+    Each selector keeps an exponentially decayed hit score, so when LinkedIn changes its
+    markup a few misses are enough to push the old winner down within the same page.
+    Stats are persisted as JSON between runs.
+
+    Args:
+        stats_path (str): JSON file the stats are loaded from and saved to
+        decay (float): Weight of the previous score on each attempt (lower re-learns faster)
+    """
+
+    def __init__(self, stats_path=DEFAULT_STATS_PATH, decay=0.7):
+        self.stats_path = stats_path
+        self.decay = decay
+        self._lock = threading.Lock()
+        self.stats = {}  # {chain: {selector: {"score", "hits", "misses"}}}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            print(f"⚠️ Selector stats file {self.stats_path} unreadable, starting fresh")
+            self.stats = {}
+
+    def save(self):
+        folder = os.path.dirname(self.stats_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.stats, indent=2)
+        tmp_path = f"{self.stats_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.stats_path)
+
+    def ordered(self, chain, selectors):
+        """Return selectors sorted best-first; ties keep their original order."""
+        with self._lock:
+            chain_stats = self.stats.get(chain, {})
+            scores = [chain_stats.get(selector, {}).get("score", UNTRIED_SCORE) for selector in selectors]
+        order = sorted(range(len(selectors)), key=lambda i: (-scores[i], i))
+        return [selectors[i] for i in order]
+
+    def record(self, chain, selector, hit):
+        """Record one attempt of selector in chain."""
+        with self._lock:
+            entry = self.stats.setdefault(chain, {}).setdefault(
+                selector, {"score": UNTRIED_SCORE, "hits": 0, "misses": 0})
+            entry["score"] = self.decay * entry["score"] + (1 - self.decay) * (1.0 if hit else 0.0)
+            entry["hits" if hit else "misses"] += 1
+
+    def record_chain(self, chain, tried_selectors, matched_selector):
+        """Record a walk over tried_selectors: every selector before the match missed."""
+        for selector in tried_selectors:
+            if selector == matched_selector:
+                self.record(chain, selector, True)
+                return
+            self.record(chain, selector, False)
+
+    def wait_for_first(self, driver, chain, selectors, timeout, condition=EC.presence_of_element_located,
+                       fmt=None):
+        """
+        Wait for the first matching XPath of a chain, trying the historical winner first.
+
+        Args:
+            driver: WebDriver to search in
+            chain (str): Name the stats are kept under
+            selectors (list): XPath templates; stats are kept per template
+            timeout (float): Seconds to wait for each selector
+            condition: expected_conditions factory taking a locator
+            fmt (dict): Values formatted into the templates, e.g. {"page": 3}
+
+        Returns:
+            tuple: (element, template) or (None, None) if nothing matched
+        """
+        for template in self.ordered(chain, selectors):
+            selector = template.format(**fmt) if fmt else template
+            try:
+                element = WebDriverWait(driver, timeout).until(condition((By.XPATH, selector)))
+                self.record(chain, template, True)
+                return element, template
+            except TimeoutException:
+                self.record(chain, template, False)
+        return None, None
+
+    def find_in(self, parent, chain, selectors):
+        """
+        Find the first matching selector under a parent element without waiting.
+
+        Selectors starting with "/" or "./" are XPath, everything else is CSS.
+
+        Returns:
+            tuple: (element, selector) or (None, None)
+        """
+        for selector in self.ordered(chain, selectors):
+            by = By.XPATH if selector.startswith(("/", "./")) else By.CSS_SELECTOR
+            elements = parent.find_elements(by, selector)
+            self.record(chain, selector, bool(elements))
+            if elements:
+                return elements[0], selector
+        return None, None
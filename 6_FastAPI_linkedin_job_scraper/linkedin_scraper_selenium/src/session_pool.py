@@ -0,0 +1,161 @@
+import threading
+import time
+
+from src.browser_profile import BROWSER_MODE, BASE_PROFILE_FOLDER, derive_worker_profile
+from src.driver_initialize_and_login import initialize_driver, login_to_linkedin
+
+# URL fragments of pages that mean the session is not usable for scraping
+UNHEALTHY_URL_FRAGMENTS = ("/checkpoint", "/challenge", "captcha", "/login", "/uas/login", "/authwall", "add-phone")
+
+
+def slot_profile_folder(slot, base_profile=BASE_PROFILE_FOLDER):
+    """Slot 0 uses the base profile, other slots get their own copy of it."""
+    if slot == 0:
+        return base_profile
+    return derive_worker_profile(slot, base_profile)
+
+
+def is_session_healthy(driver):
+    """True if the browser is alive, still holds a LinkedIn session cookie and is not
+    parked on a login or checkpoint page. Costs no page load."""
+    try:
+        url = driver.current_url.lower()
+        if any(fragment in url for fragment in UNHEALTHY_URL_FRAGMENTS):
+            return False
+        return driver.get_cookie("li_at") is not None
+    except Exception:
+        return False
+
+
+class SessionPool:
+    """
+    Owns logged-in WebDriver instances and hands them out to pipeline stages, so a browser
+    is started and logged in once per run instead of once per stage.
+
+    A driver is health-checked every time it is handed out; an unhealthy one is logged in
+    again in place, and only restarted if that fails or the browser is gone.
+
+    Args:
+        size (int): Maximum number of browsers (one profile folder each)
+        mode (str): Browser mode passed to initialize_driver ("visible" or "performance")
+        driver_factory (callable): slot -> WebDriver; defaults to initialize_driver on the slot's profile
+    """
+
+    def __init__(self, size=1, mode=BROWSER_MODE, driver_factory=None):
+        self.size = size
+        self.mode = mode
+        self.driver_factory = driver_factory or (lambda slot: initialize_driver(slot_profile_folder(slot), mode))
+        self._lock = threading.Condition()
+        self._drivers = {}  # slot -> driver
+        self._idle = []  # slots ready to be handed out
+        self.stats = {"started": 0, "reused": 0, "relogins": 0, "restarts": 0}
+
+    def _start(self, slot):
+        start = time.time()
+        driver = self.driver_factory(slot)
+        if not login_to_linkedin(driver):
+            print(f"⚠️ Browser {slot} could not log in")
+        self.stats["started"] += 1
+        print(f"🌐 Browser {slot} ready in {time.time() - start:.1f}s")
+        return driver
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _ensure_healthy(self, slot, driver):
+        if is_session_healthy(driver):
+            return driver
+        try:
+            driver.get("https://www.linkedin.com/feed/")
+            if is_session_healthy(driver):
+                return driver
+            self.stats["relogins"] += 1
+            if login_to_linkedin(driver) and is_session_healthy(driver):
+                return driver
+        except Exception as e:
+            print(f"⚠️ Browser {slot} is not responding: {e}")
+        print(f"♻️ Restarting browser {slot}")
+        self._quit(driver)
+        self.stats["restarts"] += 1
+        return self._start(slot)
+
+    def acquire(self, stage=""):
+        """Return a healthy, logged-in driver; blocks while all browsers are in use."""
+        with self._lock:
+            while not self._idle and len(self._drivers) >= self.size:
+                self._lock.wait()
+            if self._idle:
+                slot = self._idle.pop()
+                driver = self._drivers[slot]
+                self.stats["reused"] += 1
+            else:
+                slot = next(s for s in range(self.size) if s not in self._drivers)
+                driver = None
+            self._drivers[slot] = driver  # reserve the slot while the driver is started or checked
+
+        try:
+            driver = self._start(slot) if driver is None else self._ensure_healthy(slot, driver)
+        except Exception:
+            with self._lock:
+                del self._drivers[slot]
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._drivers[slot] = driver
+        if stage:
+            print(f"🔑 Browser {slot} handed to {stage}")
+        return driver
+
+    def release(self, driver, discard=False):
+        """Give a driver back. discard=True quits it so the slot starts fresh next time."""
+        with self._lock:
+            slot = next((s for s, d in self._drivers.items() if d is driver), None)
+            if slot is None:
+                return
+            if discard:
+                del self._drivers[slot]
+            else:
+                self._idle.append(slot)
+            self._lock.notify()
+        if discard:
+            self._quit(driver)
+
+    def session(self, stage=""):
+        return _PooledSession(self, stage)
+
+    def close(self):
+        """Quit every browser, e.g. to free the profile folders for other processes."""
+        with self._lock:
+            drivers = [d for d in self._drivers.values() if d is not None]
+            self._drivers.clear()
+            self._idle.clear()
+            self._lock.notify_all()
+        for driver in drivers:
+            self._quit(driver)
+        if drivers:
+            print(f"📊 Session pool: {self.stats}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _PooledSession:
+    """with pool.session("stage") as driver: ... - released even if the stage fails."""
+
+    def __init__(self, pool, stage):
+        self.pool = pool
+        self.stage = stage
+        self.driver = None
+
+    def __enter__(self):
+        self.driver = self.pool.acquire(self.stage)
+        return self.driver
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.pool.release(self.driver)
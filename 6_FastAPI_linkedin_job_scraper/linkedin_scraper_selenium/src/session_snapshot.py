@@ -0,0 +1,93 @@
+import json
+import os
+import time
+
+# Holds live LinkedIn session cookies - keep it out of version control (scraped_data/cache is ignored)
+SESSION_SNAPSHOT_PATH = os.getenv("SESSION_SNAPSHOT_PATH", "./scraped_data/cache/linkedin_session.json")
+
+# Tiny same-origin page: cookies and localStorage can only be set on the linkedin.com origin
+ORIGIN_URL = "https://www.linkedin.com/robots.txt"
+
+# One authenticated API call; 200 means the session cookies are still valid
+VERIFY_SESSION_JS = """
+const done = arguments[arguments.length - 1];
+const match = document.cookie.match(/JSESSIONID="?([^";]+)"?/);
+if (!match) { done(0); return; }
+fetch('/voyager/api/me', {credentials: 'include', headers: {'csrf-token': match[1]}})
+    .then(response => done(response.status))
+    .catch(() => done(0));
+"""
+
+
+def _on_linkedin_origin(driver):
+    if not driver.current_url.startswith("https://www.linkedin.com/"):
+        driver.get(ORIGIN_URL)
+
+
+def verify_session(driver, timeout=10):
+    """Check the browser's current LinkedIn cookies with one lightweight request."""
+    try:
+        _on_linkedin_origin(driver)
+        driver.set_script_timeout(timeout)
+        return driver.execute_async_script(VERIFY_SESSION_JS) == 200
+    except Exception as e:
+        print(f"⚠️ Session check failed: {e}")
+        return False
+
+
+def save_session_snapshot(driver, path=SESSION_SNAPSHOT_PATH):
+    """Save cookies and localStorage of a logged-in browser (atomic write, owner-only permissions)."""
+    try:
+        _on_linkedin_origin(driver)
+        snapshot = {
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script("return Object.assign({}, window.localStorage);"),
+        }
+    except Exception as e:
+        print(f"⚠️ Could not read session for snapshot: {e}")
+        return False
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f)
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, path)
+    print(f"💾 Session snapshot saved ({len(snapshot['cookies'])} cookies)")
+    return True
+
+
+def restore_session_snapshot(driver, path=SESSION_SNAPSHOT_PATH):
+    """Load a saved snapshot into the browser. Returns False if there is none or it is unreadable."""
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        print(f"⚠️ Session snapshot {path} unreadable, ignoring it")
+        return False
+
+    _on_linkedin_origin(driver)
+    now = time.time()
+    for cookie in snapshot.get("cookies", []):
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+            cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue  # cookies of other linkedin subdomains cannot be set from www
+    driver.execute_script(
+        "for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }",
+        snapshot.get("local_storage", {}))
+    return True
+
+
+def delete_session_snapshot(path=SESSION_SNAPSHOT_PATH):
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,255 @@
+import itertools
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from src.adaptive_wait import AdaptiveWaiter
+from src.browser_profile import derive_worker_profile
+from src.driver_initialize_and_login import initialize_driver, login_to_linkedin
+from src.get_company_names_1 import (apply_job_filters, navigate_to_next_page, scrape_job_listings,
+                                     get_jobs_csv_path, summarize_job_description,
+                                     selector_registry, get_search_filters, next_watermark, with_date_sort,
+                                     is_page_stale, is_first_page_usable, SUMMARY_MAX_WORKERS, SUMMARY_QUEUE_SIZE,
+                                     DEFAULT_LAST_SCRAPING_DATE, METADATA_DB_PATH, STOP_WHEN_STALE)
+from src.metadata_store import MetadataStore
+from src.summarization_pipeline import SummarizationPipeline
+from src.job_csv_writer import JobCsvWriter, job_url_key
+
+JOBS_PER_PAGE = 25
+
+
+def default_driver_factory(worker_id):
+    driver = initialize_driver(derive_worker_profile(worker_id))
+    login_to_linkedin(driver)
+    return driver
+
+
+def results_page_url(search_url, page_num):
+    """Return search_url pointing at the given 1-based results page (LinkedIn's start= offset)."""
+    parts = urlparse(search_url)
+    query = parse_qs(parts.query)
+    query["start"] = [str((page_num - 1) * JOBS_PER_PAGE)]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
+def job_dedup_key(job):
+    """Jobs are the same if they share a LinkedIn job id; fall back to the URL without its query."""
+    return job_url_key(job.get("url")) or (job.get("title"), job.get("company"))
+
+
+def build_shards(num_workers, max_pages_scraped, shard_by, industry_filter, experience_level_filter):
+    """
+    Split the search into one shard per worker.
+
+    shard_by="pages": contiguous page ranges of the same search.
+    shard_by="filters": (industry, experience level) combinations, spread round robin.
+
+    A task whose last page is max_pages_scraped has "ends_search" set: stopping there without
+    reaching a stale page leaves the rest of the search unscraped.
+    """
+    if shard_by == "pages":
+        num_workers = max(1, min(num_workers, max_pages_scraped))
+        pages_per_worker, extra = divmod(max_pages_scraped, num_workers)
+        shards, first_page = [], 1
+        for worker_idx in range(num_workers):
+            last_page = first_page + pages_per_worker - 1 + (1 if worker_idx < extra else 0)
+            shards.append([{"industries": industry_filter, "experience_levels": experience_level_filter,
+                            "first_page": first_page, "last_page": last_page,
+                            "ends_search": last_page == max_pages_scraped}])
+            first_page = last_page + 1
+        return shards
+
+    if shard_by == "filters":
+        combos = list(itertools.product(industry_filter or [None], experience_level_filter or [None]))
+        num_workers = max(1, min(num_workers, len(combos)))
+        shards = [[] for _ in range(num_workers)]
+        for combo_idx, (industry, experience_level) in enumerate(combos):
+            shards[combo_idx % num_workers].append({
+                "industries": [industry] if industry else [],
+                "experience_levels": [experience_level] if experience_level else [],
+                "first_page": 1, "last_page": max_pages_scraped, "ends_search": True})
+        return shards
+
+    raise ValueError(f"Unknown shard_by: {shard_by}")
+
+
+class ShardProgress:
+    """Thread-safe per-worker progress, printed as a small table whenever a worker reports."""
+
+    def __init__(self, shards):
+        self._lock = threading.Lock()
+        self.workers = {
+            worker_id: {"status": "starting", "task": "", "pages_done": 0,
+                        "pages_total": sum(t["last_page"] - t["first_page"] + 1 for t in tasks), "jobs": 0}
+            for worker_id, tasks in enumerate(shards, 1)
+        }
+
+    def update(self, worker_id, **fields):
+        with self._lock:
+            self.workers[worker_id].update(fields)
+            self._print()
+
+    def add(self, worker_id, pages_done=0, jobs=0):
+        with self._lock:
+            self.workers[worker_id]["pages_done"] += pages_done
+            self.workers[worker_id]["jobs"] += jobs
+            self._print()
+
+    def _print(self):
+        print("\n📊 Shard progress")
+        for worker_id, w in self.workers.items():
+            print(f"   Worker {worker_id}: {w['status']:<10} pages {w['pages_done']}/{w['pages_total']:<3} "
+                  f"jobs {w['jobs']:<4} {w['task']}")
+
+
+def scrape_shard(worker_id, tasks, driver_factory, LOCATION, JOB_TITLE, DATE_POSTED, summarizer, progress,
+                 search_url=None, last_scraping_date=DEFAULT_LAST_SCRAPING_DATE, csv_writer=None):
+    """
+    Run one worker's tasks in its own browser. With a csv_writer (shared by all workers) each
+    page is saved and its jobs marked seen as soon as it finishes, like the single-browser run.
+
+    Returns:
+        tuple: (jobs collected, complete) - complete is False if the worker failed, a page raised,
+            or a task stopped at max_pages_scraped before reaching a stale page or the last page
+    """
+    jobs = []
+    complete = True
+    driver = None
+    try:
+        driver = driver_factory(worker_id)
+        waiter = AdaptiveWaiter(driver)
+
+        for task in tasks:
+            task_label = (f"pages {task['first_page']}-{task['last_page']} "
+                          f"{task['industries'] or ''} {task['experience_levels'] or ''}").strip()
+            progress.update(worker_id, status="filtering", task=task_label)
+
+            if search_url:
+                task_search_url = search_url
+            else:
+                if not apply_job_filters(driver, JOB_TITLE, LOCATION, DATE_POSTED,
+                                         task["industries"], task["experience_levels"]):
+                    progress.update(worker_id, status="failed")
+                    complete = False
+                    continue
+                task_search_url = driver.current_url
+            if STOP_WHEN_STALE:
+                task_search_url = with_date_sort(task_search_url)
+
+            # Jump straight to the first page of this shard
+            if task["first_page"] > 1 or search_url or task_search_url != driver.current_url:
+                driver.get(results_page_url(task_search_url, task["first_page"]))
+
+            progress.update(worker_id, status="scraping")
+            page_num = task["first_page"]
+            while page_num <= task["last_page"]:
+                page_stats = {}
+                page_jobs = scrape_job_listings(driver, page_num, JOB_TITLE, summarizer, waiter,
+                                                save_page=csv_writer is not None, csv_writer=csv_writer,
+                                                last_scraping_date=last_scraping_date, page_stats=page_stats)
+                jobs.extend(page_jobs)
+                progress.add(worker_id, pages_done=1, jobs=len(page_jobs))
+                if page_stats["failed"] or (page_num == 1 and not is_first_page_usable(page_stats)):
+                    complete = False
+
+                # Results are newest first, so the rest of this shard is older than the watermark too
+                if STOP_WHEN_STALE and is_page_stale(page_stats):
+                    break
+                # No cards at all: past the end of the results. A page of seen or old (but not
+                # stale) jobs goes on to the next page, newer jobs may still follow
+                if not page_stats["cards"]:
+                    break
+                if page_num == task["last_page"]:
+                    complete = complete and not task.get("ends_search")
+                    break
+                if not navigate_to_next_page(driver, page_num, waiter=waiter):
+                    break
+                page_num += 1
+
+        progress.update(worker_id, status="done")
+    except Exception as e:
+        print(f"❌ Worker {worker_id} failed: {e}")
+        progress.update(worker_id, status="failed")
+        complete = False
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    return jobs, complete
+
+
+def merge_jobs(job_lists):
+    """Merge worker results, keeping the first copy of each job."""
+    merged, seen = [], set()
+    for jobs in job_lists:
+        for job in jobs:
+            key = job_dedup_key(job)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(job)
+    return merged
+
+
+def scrape_sharded(LOCATION, JOB_TITLE, DATE_POSTED, INDUSTRY_FILTER, max_pages_scraped, EXPERIENCE_LEVEL_FILTER,
+                   num_workers=3, shard_by="pages", driver_factory=default_driver_factory, search_url=None):
+    """
+    Scrape the job search with several browsers at once and save the merged result.
+
+    Args:
+        num_workers (int): Number of browsers, each with its own profile folder
+        shard_by (str): "pages" (disjoint page ranges) or "filters" (industry x experience level)
+        driver_factory (callable): worker_id -> ready (logged in) WebDriver
+        search_url (str): Skip apply_job_filters and page through this URL instead,
+            e.g. saved results pages served from a local fixture server
+
+    Returns:
+        list: De-duplicated jobs from all workers
+    """
+    shards = build_shards(num_workers, max_pages_scraped, shard_by, INDUSTRY_FILTER, EXPERIENCE_LEVEL_FILTER)
+    progress = ShardProgress(shards)
+    print(f"🚀 Starting {len(shards)} browser workers, sharded by {shard_by}")
+
+    metadata_store = MetadataStore(METADATA_DB_PATH)
+    search_filters = get_search_filters(DATE_POSTED, INDUSTRY_FILTER, EXPERIENCE_LEVEL_FILTER)
+    last_scraping_date = metadata_store.get_watermark(JOB_TITLE, LOCATION, search_filters,
+                                                      default=DEFAULT_LAST_SCRAPING_DATE)
+    run_started_at = datetime.utcnow()
+
+    # Workers append each finished page to one fsync'd writer, which drops jobs another worker
+    # already saved (by job id); an interrupted run keeps its rows and resumes the file
+    csv_writer = JobCsvWriter(get_jobs_csv_path(JOB_TITLE)).open()
+    run_completed = False
+    start = time.time()
+    try:
+        with SummarizationPipeline(summarize_job_description, SUMMARY_MAX_WORKERS, SUMMARY_QUEUE_SIZE) as summarizer:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [executor.submit(scrape_shard, worker_id, tasks, driver_factory, LOCATION, JOB_TITLE,
+                                           DATE_POSTED, summarizer, progress, search_url, last_scraping_date,
+                                           csv_writer)
+                           for worker_id, tasks in enumerate(shards, 1)]
+                shard_results = [future.result() for future in futures]
+        run_completed = True
+    finally:
+        csv_writer.close(completed=run_completed)
+    job_lists = [jobs for jobs, _ in shard_results]
+
+    all_jobs = merge_jobs(job_lists)
+    duplicates = sum(len(jobs) for jobs in job_lists) - len(all_jobs)
+    print(f"\n🎉 Sharded scraping complete in {time.time() - start:.0f}s: "
+          f"{len(all_jobs)} unique jobs ({duplicates} duplicates dropped)")
+    print(f"✅ {csv_writer.rows_written} rows saved to {csv_writer.path} "
+          f"({csv_writer.duplicates_skipped} already saved rows skipped)")
+
+    # A failed or cut short shard may have left newer jobs unscraped, so the watermark stays put
+    if all(complete for _, complete in shard_results):
+        metadata_store.set_watermark(JOB_TITLE, LOCATION, search_filters, next_watermark(run_started_at))
+    else:
+        print("⚠️ Some shards failed or stopped at max_pages_scraped - watermark stays where it was")
+    metadata_store.close()
+    selector_registry.save()
+    return all_jobs
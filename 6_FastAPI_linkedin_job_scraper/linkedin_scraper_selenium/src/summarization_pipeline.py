@@ -0,0 +1,76 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class SummarizationPipeline:
+    """
+    Background worker stage for job description summarization.
+
+    The scraper hands off raw descriptions with submit() and keeps clicking job cards
+    while a fixed number of worker threads run the LLM calls. The queue is bounded, so
+    if the LLM falls far behind the scraper blocks instead of buffering a whole page.
+
+    Args:
+        summarize_fn (callable): Function that takes a description and returns its summary
+        max_workers (int): Maximum number of summaries running at once
+        queue_size (int): Maximum number of descriptions waiting for a free worker
+    """
+
+    def __init__(self, summarize_fn, max_workers=4, queue_size=16):
+        self.summarize_fn = summarize_fn
+        self.max_workers = max(1, int(max_workers))
+        self.queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.submitted = 0
+        self.completed = 0
+        self._lock = threading.Lock()
+        self._workers = []
+        for worker_idx in range(self.max_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"summarizer-{worker_idx + 1}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _worker_loop(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                future, description = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self.summarize_fn(description))
+                except Exception as e:
+                    future.set_exception(e)
+                with self._lock:
+                    self.completed += 1
+            finally:
+                self.queue.task_done()
+
+    def submit(self, description):
+        """Queue a description for summarization and return a Future for its summary."""
+        future = Future()
+        with self._lock:
+            self.submitted += 1
+        self.queue.put((future, description))
+        return future
+
+    def pending(self):
+        """Number of submitted descriptions that have not been summarized yet."""
+        with self._lock:
+            return self.submitted - self.completed
+
+    def close(self):
+        """Let queued descriptions finish, then stop the worker threads."""
+        for _ in self._workers:
+            self.queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
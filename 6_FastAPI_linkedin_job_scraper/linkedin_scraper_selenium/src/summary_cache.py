@@ -0,0 +1,149 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = "./scraped_data/cache/summary_cache.db"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50 MB of cached summaries
+
+
+def normalize_description(description):
+    """Collapse whitespace and case so trivially different copies of a posting share a key."""
+    return re.sub(r"\s+", " ", description or "").strip().lower()
+
+
+def make_summary_key(description, model, prompt):
+    """Content address for a summary: hash of the normalized description, model and prompt."""
+    payload = "\x1f".join([model, prompt, normalize_description(description)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    Persistent, content-addressed cache of job description summaries (SQLite).
+
+    Entries are evicted least-recently-used first once the stored summaries exceed
+    max_bytes. Safe to share between summarization worker threads; concurrent requests
+    for the same key wait for the first one instead of issuing a duplicate LLM call.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._in_flight = {}  # key -> threading.Event set when the first caller finishes
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries(last_access)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM summaries").fetchone()[0]
+
+    def get(self, key):
+        """Return the cached summary for key, or None. Updates hit/miss stats."""
+        with self._lock:
+            row = self.conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+            return row[0]
+
+    def put(self, key, summary):
+        """Store a summary and evict least-recently-used entries if over the size limit."""
+        size_bytes = len(summary.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            old = self.conn.execute("SELECT size_bytes FROM summaries WHERE key = ?", (key,)).fetchone()
+            if old:
+                self.total_bytes -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, size_bytes, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, summary, size_bytes, now, now))
+            self.total_bytes += size_bytes
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            row = self.conn.execute(
+                "SELECT key, size_bytes FROM summaries ORDER BY last_access ASC LIMIT 1").fetchone()
+            if row is None:
+                break
+            self.conn.execute("DELETE FROM summaries WHERE key = ?", (row[0],))
+            self.total_bytes -= row[1]
+            self.evictions += 1
+
+    def get_or_compute(self, key, compute_fn, should_store=lambda summary: True):
+        """
+        Return the cached summary for key, calling compute_fn() only on a miss.
+
+        If another thread is already computing the same key, wait for it and reuse its
+        result. Results rejected by should_store (e.g. API errors) are returned but not cached.
+        """
+        while True:
+            summary = self.get(key)
+            if summary is not None:
+                return summary
+
+            with self._lock:
+                event = self._in_flight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._in_flight[key] = event
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                event.wait()
+                with self._lock:
+                    # The miss above was a wait, not a lookup that will cost an LLM call
+                    self.misses -= 1
+                continue
+
+            try:
+                summary = compute_fn()
+                if should_store(summary):
+                    self.put(key, summary)
+                return summary
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                event.set()
+
+    def stats(self):
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": self.total_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
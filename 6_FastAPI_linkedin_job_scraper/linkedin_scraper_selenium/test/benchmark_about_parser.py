@@ -0,0 +1,109 @@
+"""
+Benchmark the company About-page parser on saved pages in test/about_fixtures.
+
+Compares the old line scan over the section text with the structured parser (<dt>/<dd>,
+JSON-LD, then text) for accuracy against expected.json and parse time per page.
+
+    python test/benchmark_about_parser.py            # offline, parses the saved HTML
+    python test/benchmark_about_parser.py --browser  # also times ABOUT_SNAPSHOT_JS in headless Chrome
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.about_parser import parse_about_snapshot, snapshot_from_html, ABOUT_SNAPSHOT_JS
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "about_fixtures")
+FIELDS = ("website", "industry", "company_size")
+ROUNDS = 200
+
+
+def legacy_parse(about_section_text):
+    """The original stage 2 text scan, kept here as the baseline."""
+    lines = about_section_text.split('\n')
+    website = industry = company_size = "unknown"
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if line == "Website":
+            if i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                if "www" in next_line or "http" in next_line:
+                    website = next_line
+        if line == "Industry":
+            next_line = lines[i + 1].strip()
+            next_to_next_line = lines[i + 2].strip()
+            if "Company size" in next_to_next_line:
+                industry = next_line
+        if line == "Company size":
+            if i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                if "employees" in next_line:
+                    company_size = next_line
+    return dict(zip(FIELDS, (website, industry, company_size)))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def score(result, expected):
+    return sum(result.get(field) == expected[field] for field in FIELDS)
+
+
+def run_offline(expected):
+    totals = {"legacy": 0, "structured": 0}
+    print(f"{'fixture':<28} {'legacy':>12} {'structured':>12}   sources")
+    for fixture, wanted in expected.items():
+        with open(os.path.join(FIXTURE_DIR, fixture), 'r', encoding='utf-8') as f:
+            snapshot = snapshot_from_html(f.read())
+
+        try:
+            legacy, legacy_ms = timed(legacy_parse, snapshot["text"])
+        except IndexError:
+            legacy, legacy_ms = {field: "unknown" for field in FIELDS}, 0.0
+            print(f"   {fixture}: legacy parser raised IndexError (page counted as all unknown)")
+        structured, structured_ms = timed(parse_about_snapshot, snapshot)
+
+        legacy_score, structured_score = score(legacy, wanted), score(structured, wanted)
+        totals["legacy"] += legacy_score
+        totals["structured"] += structured_score
+        print(f"{fixture:<28} {legacy_score}/3 {legacy_ms:5.3f}ms {structured_score}/3 {structured_ms:5.3f}ms   "
+              f"{structured['source']}")
+        for field in FIELDS:
+            if structured[field] != wanted[field]:
+                print(f"   ❌ {field}: got {structured[field]!r}, expected {wanted[field]!r}")
+
+    possible = 3 * len(expected)
+    print(f"\nFields correct: legacy {totals['legacy']}/{possible}, structured {totals['structured']}/{possible}")
+    return totals["structured"] == possible
+
+
+def run_browser(expected):
+    from src.browser_profile import create_chrome_driver
+
+    driver = create_chrome_driver(mode="performance")
+    try:
+        print(f"\n{'fixture':<28} {'snapshot JS':>12}")
+        for fixture, wanted in expected.items():
+            driver.get("file://" + os.path.join(FIXTURE_DIR, fixture))
+            start = time.perf_counter()
+            result = parse_about_snapshot(driver.execute_script(ABOUT_SNAPSHOT_JS))
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{fixture:<28} {score(result, wanted)}/3 {elapsed:6.1f}ms (one round trip)")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    with open(os.path.join(FIXTURE_DIR, "expected.json"), 'r', encoding='utf-8') as f:
+        expected_results = json.load(f)
+    all_correct = run_offline(expected_results)
+    if "--browser" in sys.argv:
+        run_browser(expected_results)
+    sys.exit(0 if all_correct else 1)
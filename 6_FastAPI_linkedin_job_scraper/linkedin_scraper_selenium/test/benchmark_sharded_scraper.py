@@ -0,0 +1,139 @@
+"""
+Run the sharded job-search scraper with headless Chrome against the saved results pages in
+test/sharded_fixtures, served by a local HTTP server (the "start=" offset picks the page).
+
+Checks that jobs were scraped at all, that every job is collected once (a job shown on two
+pages with different tracking parameters is merged), that a run cut short at
+max_pages_scraped returns exactly the jobs of the pages it covered, that the CSV holds one
+row per job, and that the watermark only moves when the shards reached the last page.
+Summaries are replaced by a local stub, and all caches and output go to a temporary folder.
+
+    python test/benchmark_sharded_scraper.py              # 2 workers
+    python test/benchmark_sharded_scraper.py --workers 1  # compare with a single browser
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sharded_fixtures")
+sys.path.insert(0, ROOT)
+
+# Everything the scraper writes (CSV, metadata, seen jobs, caches) lands in a scratch folder
+os.chdir(tempfile.mkdtemp(prefix="sharded_fixtures_"))
+os.environ.setdefault("LINKEDIN_EMAIL", "fixture@example.com")
+os.environ.setdefault("LINKEDIN_PASSWORD", "unused")
+os.environ.setdefault("WAIT_MIN_JITTER", "0")
+os.environ.setdefault("WAIT_MAX_JITTER", "0.05")
+
+from src import get_company_names_1, sharded_scraper
+from src.browser_profile import create_chrome_driver
+from src.get_company_names_1 import get_jobs_csv_path, get_search_filters, METADATA_DB_PATH
+from src.job_csv_writer import job_url_key
+from src.metadata_store import MetadataStore
+
+JOB_TITLE = "fixture_jobs"
+LOCATION = "Germany"
+DATE_POSTED = "Any time"
+
+
+class ResultsPageHandler(SimpleHTTPRequestHandler):
+    """Serves results_page_<n>.html for /jobs/search/?start=<(n - 1) * 25>, 404 past the last page."""
+
+    def do_GET(self):
+        parts = urlparse(self.path)
+        if parts.path.rstrip("/") != "/jobs/search":
+            self.send_error(404)
+            return
+        start = int(parse_qs(parts.query).get("start", ["0"])[0])
+        page_path = os.path.join(FIXTURE_DIR, f"results_page_{start // sharded_scraper.JOBS_PER_PAGE + 1}.html")
+        if not os.path.exists(page_path):
+            self.send_error(404)
+            return
+        with open(page_path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def fixture_driver_factory(worker_id):
+    return create_chrome_driver(mode="performance")
+
+
+def stub_summary(description):
+    return f"Summary: {description[:40]}"
+
+
+def run_scenario(search_url, max_pages_scraped, num_workers):
+    """Scrape into a fresh output folder; returns (jobs, csv rows, elapsed seconds, watermark moved)."""
+    os.chdir(tempfile.mkdtemp(prefix="sharded_run_"))
+    if get_company_names_1.seen_jobs_index is not None:
+        get_company_names_1.seen_jobs_index.close()
+        get_company_names_1.seen_jobs_index = None  # reopened in this run's folder
+    start = time.perf_counter()
+    jobs = sharded_scraper.scrape_sharded(LOCATION, JOB_TITLE, DATE_POSTED, [], max_pages_scraped, [],
+                                          num_workers=num_workers, shard_by="pages",
+                                          driver_factory=fixture_driver_factory, search_url=search_url)
+    elapsed = time.perf_counter() - start
+
+    with open(get_jobs_csv_path(JOB_TITLE), "r", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    metadata_store = MetadataStore(METADATA_DB_PATH)
+    watermark = metadata_store.get_watermark(JOB_TITLE, LOCATION, get_search_filters(DATE_POSTED, [], []))
+    metadata_store.close()
+    return jobs, rows, elapsed, watermark is not None
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+    return passed
+
+
+if __name__ == "__main__":
+    num_workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 2
+    with open(os.path.join(FIXTURE_DIR, "expected.json"), "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    # Summaries come from a stub instead of the LLM API
+    sharded_scraper.summarize_job_description = stub_summary
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ResultsPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    search_url = f"http://127.0.0.1:{server.server_port}/jobs/search/?keywords=data&location={LOCATION}"
+
+    all_passed = True
+    try:
+        # One page more than the fixtures have, so the last shard runs out of pages
+        jobs, rows, elapsed, watermark_moved = run_scenario(search_url, 4, num_workers)
+        job_ids = sorted(job_url_key(job["url"]) for job in jobs)
+        print(f"\nFull search, {num_workers} workers: {len(jobs)} jobs in {elapsed:.1f}s")
+        all_passed &= check("jobs scraped", len(jobs) > 0)
+        all_passed &= check(f"every job once ({len(expected['job_ids'])})", job_ids == expected["job_ids"])
+        all_passed &= check("one CSV row per job", sorted(job_url_key(row["url"]) for row in rows) == job_ids)
+        all_passed &= check("summaries joined to every row", all(row["job_description"] for row in rows))
+        all_passed &= check("watermark moved after reaching the last page", watermark_moved)
+
+        # Stopping at max_pages_scraped leaves page 3 unscraped, so the watermark must stay put
+        jobs, rows, elapsed, watermark_moved = run_scenario(search_url, 2, num_workers)
+        job_ids = sorted(job_url_key(job["url"]) for job in jobs)
+        print(f"\nFirst 2 pages only, {num_workers} workers: {len(jobs)} jobs in {elapsed:.1f}s")
+        all_passed &= check("jobs scraped", len(jobs) > 0)
+        all_passed &= check(f"only the jobs of pages 1-2 ({len(expected['job_ids_first_2_pages'])})",
+                            job_ids == expected["job_ids_first_2_pages"])
+        all_passed &= check("watermark kept when cut short at max_pages_scraped", not watermark_moved)
+    finally:
+        server.shutdown()
+
+    print(f"\n{'All checks passed' if all_passed else 'Some checks failed'}")
+    sys.exit(0 if all_passed else 1)